@@ -4,224 +4,409 @@ Main script for API Data Collector
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from src.collectors.github_collector import GitHubCollector
 from src.collectors.github_scraper import GitHubScraper
 from src.parsers.github_parser import GitHubParser
 from src.exporters.json_exporter import JSONExporter
 from src.exporters.csv_exporter import CSVExporter
-from src.config import get_settings
+from src.config import Settings, get_settings
+from src.core.base_exporter import BaseExporter
 from src.utils.logger import setup_logger
+from src.utils.cache import ApiCache
+from src.utils.pipeline import batched, pipelined
 
 
-def collect_repos(username: str, export_format: str = 'json'):
+# Items handed from the fetch stage to the parse stage at a time (one API page)
+PIPELINE_BATCH_SIZE = 100
+
+# Targets collected concurrently when several are given in one invocation
+BATCH_WORKERS = 8
+
+
+def read_targets(values: Sequence[str], file_path: Optional[str] = None) -> List[str]:
     """
-    Collect and export user repositories.
+    Combine targets given on the command line and in a targets file.
     
     Args:
-        username: GitHub username
-        export_format: Export format (json or csv)
+        values: Targets from the command line
+        file_path: Optional file with one target per line ('#' starts a comment)
+        
+    Returns:
+        List of targets in order
     """
-    settings = get_settings()
-    logger = setup_logger(level=settings.log_level)
-    
-    logger.info(f"Starting repository collection for user: {username}")
-    
-    # Initialize components
-    collector = GitHubCollector(api_key=settings.github_token)
-    parser = GitHubParser()
+    targets = list(values)
+    if file_path:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    targets.append(line)
+    return targets
+
+
+def parse_repo_targets(values: Sequence[str]) -> List[Tuple[str, str]]:
+    """
+    Parse repository targets given as 'owner repo' or as 'owner/repo' items.
     
-    # Collect data
-    try:
-        raw_data = collector.collect_user_repos(username)
-        logger.info(f"Collected {len(raw_data)} repositories")
-        
-        # Parse data
-        parsed_data = parser.parse(raw_data, data_type='repos')
-        logger.info(f"Parsed {len(parsed_data)} repositories")
-        
-        # Export data
-        if export_format.lower() == 'csv':
-            exporter = CSVExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(parsed_data, f"{username}_repos.csv")
-        else:
-            exporter = JSONExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(parsed_data, f"{username}_repos.json")
+    Args:
+        values: Raw targets
         
-        logger.info(f"Data exported to: {file_path}")
-        return file_path
+    Returns:
+        List of (owner, repo) pairs
         
-    except Exception as e:
-        logger.error(f"Error collecting repositories: {e}")
-        sys.exit(1)
+    Raises:
+        ValueError: If the targets cannot be paired up
+    """
+    if len(values) == 2 and not any('/' in value for value in values):
+        return [(values[0], values[1])]
+    
+    pairs = []
+    for value in values:
+        owner, _, repo = value.partition('/')
+        if not owner or not repo or '/' in repo:
+            raise ValueError(f"Expected owner/repo, got: {value}")
+        pairs.append((owner, repo))
+    return pairs
 
 
-def collect_issues(owner: str, repo: str, export_format: str = 'json'):
+class CollectorApp:
     """
-    Collect and export repository issues.
+    Shared components for CLI commands.
     
-    Args:
-        owner: Repository owner
-        repo: Repository name
-        export_format: Export format (json or csv)
+    Settings, logger, collectors, parser and exporters are created once
+    (lazily, on first use) and reused by every command, so a script running
+    several collections shares one HTTP session and its open connections.
     """
-    settings = get_settings()
-    logger = setup_logger(level=settings.log_level)
     
-    logger.info(f"Starting issue collection for {owner}/{repo}")
+    def __init__(self, settings: Optional[Settings] = None):
+        """
+        Initialize the application.
+        
+        Args:
+            settings: Settings to use (defaults to get_settings())
+        """
+        self.settings = settings or get_settings()
+        self.logger = setup_logger(level=self.settings.log_level)
     
-    # Initialize components
-    collector = GitHubCollector(api_key=settings.github_token)
-    parser = GitHubParser()
+    @cached_property
+    def collector(self) -> GitHubCollector:
+        """GitHub API collector."""
+        settings = self.settings
+        return GitHubCollector(
+            api_key=settings.github_token,
+            api_keys=settings.github_tokens,
+            etag_cache_path=settings.etag_cache_path,
+            cache_dir=settings.cache_dir,
+            http2=settings.http2,
+            concurrent_batches=BATCH_WORKERS
+        )
     
-    # Collect data
-    try:
-        raw_data = collector.collect_repo_issues(owner, repo)
-        logger.info(f"Collected {len(raw_data)} issues")
-        
-        # Parse data
-        parsed_data = parser.parse(raw_data, data_type='issues')
-        logger.info(f"Parsed {len(parsed_data)} issues")
-        
-        # Export data
-        filename = f"{owner}_{repo}_issues"
-        if export_format.lower() == 'csv':
-            exporter = CSVExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(parsed_data, f"{filename}.csv")
-        else:
-            exporter = JSONExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(parsed_data, f"{filename}.json")
-        
-        logger.info(f"Data exported to: {file_path}")
-        return file_path
+    @cached_property
+    def scraper(self) -> GitHubScraper:
+        """GitHub Trending scraper."""
+        return GitHubScraper(cache_dir=self.settings.cache_dir)
+    
+    @cached_property
+    def parser(self) -> GitHubParser:
+        """GitHub data parser."""
+        return GitHubParser()
+    
+    @cached_property
+    def json_exporter(self) -> JSONExporter:
+        """JSON exporter writing to the output directory."""
+        return JSONExporter(output_dir=self.settings.output_dir)
+    
+    @cached_property
+    def csv_exporter(self) -> CSVExporter:
+        """CSV exporter writing to the output directory."""
+        return CSVExporter(output_dir=self.settings.output_dir)
+    
+    def exporter(self, export_format: str) -> BaseExporter:
+        """
+        Get the exporter for a format.
         
-    except Exception as e:
-        logger.error(f"Error collecting issues: {e}")
-        sys.exit(1)
-
-
-def collect_prs(owner: str, repo: str, export_format: str = 'json'):
-    """
-    Collect and export pull requests.
+        Args:
+            export_format: Export format (json or csv)
+            
+        Returns:
+            Exporter instance
+        """
+        return self.csv_exporter if export_format.lower() == 'csv' else self.json_exporter
     
-    Args:
-        owner: Repository owner
-        repo: Repository name
-        export_format: Export format (json or csv)
-    """
-    settings = get_settings()
-    logger = setup_logger(level=settings.log_level)
+    def close(self) -> None:
+        """Close the collectors that have been created."""
+        for name in ('collector', 'scraper'):
+            component = self.__dict__.pop(name, None)
+            if component is not None:
+                component.__exit__(None, None, None)
     
-    logger.info(f"Starting PR collection for {owner}/{repo}")
+    def __enter__(self):
+        """Context manager entry."""
+        return self
     
-    # Initialize components
-    collector = GitHubCollector(api_key=settings.github_token)
-    parser = GitHubParser()
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
     
-    # Collect data
-    try:
-        raw_data = collector.collect_pull_requests(owner, repo)
-        logger.info(f"Collected {len(raw_data)} pull requests")
+    def run_batch(
+        self,
+        command: Callable[..., str],
+        targets: Sequence[Tuple[str, ...]],
+        max_workers: int = BATCH_WORKERS,
+        **kwargs
+    ) -> List[str]:
+        """
+        Run a command for several targets concurrently.
         
-        # Parse data
-        parsed_data = parser.parse(raw_data, data_type='prs')
-        logger.info(f"Parsed {len(parsed_data)} pull requests")
+        All targets share this app's collector, and with it one HTTP session,
+        connection pool and rate limiter. A failing target is logged and does
+        not stop the others.
         
-        # Export data
-        filename = f"{owner}_{repo}_prs"
-        if export_format.lower() == 'csv':
-            exporter = CSVExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(parsed_data, f"{filename}.csv")
-        else:
-            exporter = JSONExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(parsed_data, f"{filename}.json")
+        Args:
+            command: Bound command method, e.g. ``app.repos``
+            targets: Positional arguments for each invocation
+            max_workers: Maximum number of targets collected at once
+            **kwargs: Keyword arguments passed to every invocation
+            
+        Returns:
+            Paths of the exported files
+            
+        Raises:
+            RuntimeError: If any target failed
+        """
+        if len(targets) == 1:
+            return [command(*targets[0], **kwargs)]
         
-        logger.info(f"Data exported to: {file_path}")
-        return file_path
+        # cached_property is not thread-safe; build shared components up front
+        for name in ('collector', 'scraper', 'parser', 'json_exporter', 'csv_exporter'):
+            getattr(self, name)
         
-    except Exception as e:
-        logger.error(f"Error collecting pull requests: {e}")
-        sys.exit(1)
-
-
-def collect_profile(username: str, export_format: str = 'json'):
-    """
-    Collect and export user profile.
-    
-    Args:
-        username: GitHub username
-        export_format: Export format (json or csv)
-    """
-    settings = get_settings()
-    logger = setup_logger(level=settings.log_level)
-    
-    logger.info(f"Starting profile collection for user: {username}")
-    
-    # Initialize components
-    collector = GitHubCollector(api_key=settings.github_token)
-    parser = GitHubParser()
+        def run_one(target: Tuple[str, ...]) -> Optional[str]:
+            try:
+                return command(*target, **kwargs)
+            except Exception as e:
+                self.logger.error("Error collecting %s: %s", '/'.join(target) or 'all', e)
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(targets))) as executor:
+            results = list(executor.map(run_one, targets))
+        
+        paths = [path for path in results if path]
+        failed = len(results) - len(paths)
+        if failed:
+            raise RuntimeError(f"{failed} of {len(targets)} targets failed")
+        return paths
     
-    # Collect data
-    try:
-        raw_data = collector.collect_user_profile(username)
-        logger.info("Profile collected")
+    def export_pipelined(
+        self,
+        items: Iterable[Dict[str, Any]],
+        data_type: str,
+        filename: str,
+        export_format: str
+    ) -> str:
+        """
+        Parse and export collected items while later pages are still being fetched.
+        
+        Fetching, parsing and writing run as separate pipeline stages connected
+        by bounded queues.
         
-        # Parse data
-        parsed_data = parser.parse(raw_data, data_type='profile')
-        logger.info("Profile parsed")
+        Args:
+            items: Lazy iterator of raw items from the collector
+            data_type: Parser data type (repos, issues, prs)
+            filename: Output filename without extension
+            export_format: Export format (json or csv)
+            
+        Returns:
+            Path to exported file
+        """
+        batches = pipelined(
+            batched(items, PIPELINE_BATCH_SIZE),
+            partial(self.parser.parse, data_type=data_type)
+        )
+        rows = chain.from_iterable(batches)
         
-        # Export data
         if export_format.lower() == 'csv':
-            exporter = CSVExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(parsed_data, f"{username}_profile.csv")
-        else:
-            exporter = JSONExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(parsed_data, f"{username}_profile.json")
+            # The parser's fixed schema lets rows be written as they arrive
+            return self.csv_exporter.export(
+                rows, f"{filename}.csv", fieldnames=self.parser.FIELDS[data_type]
+            )
         
-        logger.info(f"Data exported to: {file_path}")
-        return file_path
+        return self.json_exporter.export_stream(rows, f"{filename}.json")
+    
+    def repos(self, username: str, export_format: str = 'json', refresh: bool = False) -> str:
+        """
+        Collect and export user repositories.
         
-    except Exception as e:
-        logger.error(f"Error collecting profile: {e}")
-        sys.exit(1)
-
-
-def collect_trending(language: str = '', since: str = 'daily', export_format: str = 'json'):
-    """
-    Collect and export trending repositories.
+        Args:
+            username: GitHub username
+            export_format: Export format (json or csv)
+            refresh: Bypass the response cache
+            
+        Returns:
+            Path to exported file
+        """
+        self.logger.info("Starting repository collection for user: %s", username)
+        
+        # Collect, parse and export concurrently, page by page
+        file_path = self.export_pipelined(
+            self.collector.iter_user_repos(username, refresh=refresh),
+            'repos',
+            f"{username}_repos",
+            export_format
+        )
+        
+        self.logger.info("Data exported to: %s", file_path)
+        return file_path
     
-    Args:
-        language: Programming language
-        since: Time range (daily, weekly, monthly)
-        export_format: Export format (json or csv)
-    """
-    settings = get_settings()
-    logger = setup_logger(level=settings.log_level)
+    def issues(
+        self,
+        owner: str,
+        repo: str,
+        export_format: str = 'json',
+        refresh: bool = False
+    ) -> str:
+        """
+        Collect and export repository issues.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            export_format: Export format (json or csv)
+            refresh: Bypass the response cache
+            
+        Returns:
+            Path to exported file
+        """
+        self.logger.info("Starting issue collection for %s/%s", owner, repo)
+        
+        file_path = self.export_pipelined(
+            self.collector.iter_repo_issues(owner, repo, refresh=refresh),
+            'issues',
+            f"{owner}_{repo}_issues",
+            export_format
+        )
+        
+        self.logger.info("Data exported to: %s", file_path)
+        return file_path
     
-    logger.info(f"Starting trending collection for {language if language else 'all languages'} ({since})")
+    def prs(
+        self,
+        owner: str,
+        repo: str,
+        export_format: str = 'json',
+        refresh: bool = False
+    ) -> str:
+        """
+        Collect and export pull requests.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            export_format: Export format (json or csv)
+            refresh: Bypass the response cache
+            
+        Returns:
+            Path to exported file
+        """
+        self.logger.info("Starting PR collection for %s/%s", owner, repo)
+        
+        file_path = self.export_pipelined(
+            self.collector.iter_pull_requests(owner, repo, refresh=refresh),
+            'prs',
+            f"{owner}_{repo}_prs",
+            export_format
+        )
+        
+        self.logger.info("Data exported to: %s", file_path)
+        return file_path
     
-    # Initialize components
-    scraper = GitHubScraper()
+    def profile(self, username: str, export_format: str = 'json', refresh: bool = False) -> str:
+        """
+        Collect and export user profile.
+        
+        Args:
+            username: GitHub username
+            export_format: Export format (json or csv)
+            refresh: Bypass the response cache
+            
+        Returns:
+            Path to exported file
+        """
+        self.logger.info("Starting profile collection for user: %s", username)
+        
+        raw_data = self.collector.collect_user_profile(username, refresh=refresh)
+        self.logger.info("Profile collected")
+        
+        parsed_data = self.parser.parse(raw_data, data_type='profile')
+        self.logger.info("Profile parsed")
+        
+        extension = 'csv' if export_format.lower() == 'csv' else 'json'
+        file_path = self.exporter(export_format).export(
+            parsed_data, f"{username}_profile.{extension}"
+        )
+        
+        self.logger.info("Data exported to: %s", file_path)
+        return file_path
     
-    # Collect data
-    try:
-        data = scraper.collect_trending(language, since)
-        logger.info(f"Collected {len(data)} trending repositories")
+    def trending(
+        self,
+        language: str = '',
+        since: str = 'daily',
+        export_format: str = 'json',
+        refresh: bool = False
+    ) -> str:
+        """
+        Collect and export trending repositories.
+        
+        Args:
+            language: Programming language
+            since: Time range (daily, weekly, monthly)
+            export_format: Export format (json or csv)
+            refresh: Bypass the response cache
+            
+        Returns:
+            Path to exported file
+        """
+        self.logger.info(
+            "Starting trending collection for %s (%s)", language or 'all languages', since
+        )
+        
+        data = self.scraper.collect_trending(language, since, refresh=refresh)
+        self.logger.info("Collected %d trending repositories", len(data))
         
-        # Export data
         filename = f"trending_{language if language else 'all'}_{since}"
-        if export_format.lower() == 'csv':
-            exporter = CSVExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(data, f"{filename}.csv")
-        else:
-            exporter = JSONExporter(output_dir=settings.output_dir)
-            file_path = exporter.export(data, f"{filename}.json")
+        extension = 'csv' if export_format.lower() == 'csv' else 'json'
+        file_path = self.exporter(export_format).export(data, f"{filename}.{extension}")
         
-        logger.info(f"Data exported to: {file_path}")
+        self.logger.info("Data exported to: %s", file_path)
         return file_path
+    
+    def cache(self, action: str) -> None:
+        """
+        Inspect or clear the response cache.
         
-    except Exception as e:
-        logger.error(f"Error collecting trending repos: {e}")
-        sys.exit(1)
+        Args:
+            action: Cache action (clear or status)
+        """
+        if not self.settings.cache_dir:
+            self.logger.info("Response cache is disabled (CACHE_DIR is empty)")
+            return
+        
+        cache = ApiCache(self.settings.cache_dir)
+        
+        if action == 'clear':
+            removed = cache.clear()
+            self.logger.info("Removed %d cache entries from %s", removed, cache.cache_dir)
+        else:
+            status = cache.status()
+            self.logger.info(
+                "Cache %s: %d entries (%d expired), %d bytes",
+                status['path'], status['entries'], status['expired'], status['size_bytes']
+            )
 
 
 def main():
@@ -234,37 +419,56 @@ def main():
     
     # Repos command
     repos_parser = subparsers.add_parser('repos', help='Collect user repositories')
-    repos_parser.add_argument('username', help='GitHub username')
+    repos_parser.add_argument('username', nargs='*', help='GitHub username(s)')
+    repos_parser.add_argument('--file', help='File with one username per line')
     repos_parser.add_argument('--format', choices=['json', 'csv'], default='json',
                              help='Export format (default: json)')
+    repos_parser.add_argument('--refresh', action='store_true',
+                             help='Bypass the response cache')
     
     # Issues command
     issues_parser = subparsers.add_parser('issues', help='Collect repository issues')
-    issues_parser.add_argument('owner', help='Repository owner')
-    issues_parser.add_argument('repo', help='Repository name')
+    issues_parser.add_argument('repository', nargs='*',
+                              help='Repository as "owner repo", or one or more owner/repo')
+    issues_parser.add_argument('--file', help='File with one owner/repo per line')
     issues_parser.add_argument('--format', choices=['json', 'csv'], default='json',
                               help='Export format (default: json)')
+    issues_parser.add_argument('--refresh', action='store_true',
+                              help='Bypass the response cache')
     
     # PRs command
     prs_parser = subparsers.add_parser('prs', help='Collect pull requests')
-    prs_parser.add_argument('owner', help='Repository owner')
-    prs_parser.add_argument('repo', help='Repository name')
+    prs_parser.add_argument('repository', nargs='*',
+                           help='Repository as "owner repo", or one or more owner/repo')
+    prs_parser.add_argument('--file', help='File with one owner/repo per line')
     prs_parser.add_argument('--format', choices=['json', 'csv'], default='json',
                            help='Export format (default: json)')
+    prs_parser.add_argument('--refresh', action='store_true',
+                           help='Bypass the response cache')
     
     # Profile command
     profile_parser = subparsers.add_parser('profile', help='Collect user profile')
-    profile_parser.add_argument('username', help='GitHub username')
+    profile_parser.add_argument('username', nargs='*', help='GitHub username(s)')
+    profile_parser.add_argument('--file', help='File with one username per line')
     profile_parser.add_argument('--format', choices=['json', 'csv'], default='json',
                                help='Export format (default: json)')
+    profile_parser.add_argument('--refresh', action='store_true',
+                               help='Bypass the response cache')
     
     # Trending command
     trending_parser = subparsers.add_parser('trending', help='Collect trending repositories')
-    trending_parser.add_argument('--language', default='', help='Programming language')
+    trending_parser.add_argument('--language', nargs='+', default=[''],
+                                help='Programming language(s)')
     trending_parser.add_argument('--since', choices=['daily', 'weekly', 'monthly'], default='daily',
                                 help='Time range (default: daily)')
     trending_parser.add_argument('--format', choices=['json', 'csv'], default='json',
                                 help='Export format (default: json)')
+    trending_parser.add_argument('--refresh', action='store_true',
+                                help='Bypass the response cache')
+    
+    # Cache command
+    cache_parser = subparsers.add_parser('cache', help='Manage the response cache')
+    cache_parser.add_argument('action', choices=['clear', 'status'], help='Cache action')
     
     args = parser.parse_args()
     
@@ -272,17 +476,35 @@ def main():
         parser.print_help()
         sys.exit(1)
     
-    # Route to appropriate function
-    if args.command == 'repos':
-        collect_repos(args.username, args.format)
-    elif args.command == 'issues':
-        collect_issues(args.owner, args.repo, args.format)
-    elif args.command == 'prs':
-        collect_prs(args.owner, args.repo, args.format)
-    elif args.command == 'profile':
-        collect_profile(args.username, args.format)
+    # Resolve the targets of batchable commands
+    targets: List[Tuple[str, ...]] = []
+    if args.command in ('repos', 'profile'):
+        targets = [(username,) for username in read_targets(args.username, args.file)]
+    elif args.command in ('issues', 'prs'):
+        try:
+            targets = parse_repo_targets(read_targets(args.repository, args.file))
+        except ValueError as e:
+            parser.error(str(e))
     elif args.command == 'trending':
-        collect_trending(args.language, args.since, args.format)
+        targets = [(language,) for language in args.language]
+    
+    if args.command != 'cache' and not targets:
+        parser.error(f"{args.command}: no targets given")
+    
+    # Route to the matching CollectorApp command
+    with CollectorApp() as app:
+        try:
+            if args.command == 'trending':
+                app.run_batch(app.trending, targets, since=args.since,
+                              export_format=args.format, refresh=args.refresh)
+            elif args.command == 'cache':
+                app.cache(args.action)
+            else:
+                command = getattr(app, args.command)
+                app.run_batch(command, targets, export_format=args.format, refresh=args.refresh)
+        except Exception as e:
+            app.logger.error("Error running %s: %s", args.command, e)
+            sys.exit(1)
 
 
 if __name__ == '__main__':
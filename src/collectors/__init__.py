@@ -3,5 +3,6 @@ Data collection modules
 """
 
 from .github_collector import GitHubCollector
+from .github_graphql import GitHubGraphQLCollector
 
-__all__ = ['GitHubCollector']
+__all__ = ['GitHubCollector', 'GitHubGraphQLCollector']
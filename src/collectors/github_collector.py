@@ -3,8 +3,15 @@ GitHub API data collector
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-from ..core.base_collector import BaseCollector
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from urllib.parse import parse_qs, urlparse
+import requests
+from ..core.base_collector import BaseCollector, _json, memoized_collect
+from ..utils.cache import ApiCache
+from ..utils.etag_store import ETagStore
+from ..utils.pipeline import batched
+from ..utils.rate_limiter import TokenBucket
+from .token_pool import TokenPool
 
 
 class GitHubCollector(BaseCollector):
@@ -18,11 +25,23 @@ class GitHubCollector(BaseCollector):
     - User profile information
     """
     
+    # Response cache TTLs in seconds
+    LIST_CACHE_TTL = 15 * 60
+    PROFILE_CACHE_TTL = 60 * 60
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         rate_limit_delay: float = 0.5,
-        max_retries: int = 3
+        max_retries: int = 3,
+        max_workers: int = 8,
+        etag_cache_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        api_keys: Optional[Sequence[str]] = None,
+        http2: bool = False,
+        rate_limits: Optional[Sequence[TokenBucket]] = None,
+        memoize: bool = False,
+        concurrent_batches: int = 1
     ):
         """
         Initialize GitHub collector.
@@ -31,13 +50,37 @@ class GitHubCollector(BaseCollector):
             api_key: GitHub personal access token
             rate_limit_delay: Delay between requests (GitHub allows 5000 req/hour with auth)
             max_retries: Maximum retry attempts
+            max_workers: Maximum number of pages fetched concurrently
+            etag_cache_path: SQLite file for ETags; enables conditional requests
+            cache_dir: Directory for the TTL response cache; enables caching
+            api_keys: Additional tokens to rotate between, raising the overall rate limit
+            http2: Multiplex requests over HTTP/2 (requires ``httpx[http2]``)
+            rate_limits: Token buckets limiting request throughput; defaults to a
+                bucket refilled every rate_limit_delay seconds that lets up to
+                max_workers requests burst
+            memoize: Keep ``collect`` results in memory for five minutes
+            concurrent_batches: Number of collections run at once on this collector
         """
+        if rate_limits is None and rate_limit_delay > 0:
+            rate_limits = [TokenBucket(max_workers, 1 / rate_limit_delay)]
+        
         super().__init__(
             base_url="https://api.github.com",
             api_key=api_key,
             rate_limit_delay=rate_limit_delay,
-            max_retries=max_retries
+            max_retries=max_retries,
+            etag_store=ETagStore(etag_cache_path) if etag_cache_path else None,
+            cache=ApiCache(cache_dir, default_ttl=self.LIST_CACHE_TTL) if cache_dir else None,
+            http2=http2,
+            rate_limits=rate_limits,
+            max_workers=max_workers,
+            memoize=memoize,
+            concurrent_batches=concurrent_batches
         )
+        
+        tokens = ([api_key] if api_key else []) + list(api_keys or [])
+        self.token_pool = TokenPool(tokens) if api_keys else None
+        self._cache_scope = self._credential_scope(tokens)
         self.logger = logging.getLogger(self.__class__.__name__)
     
     def _set_auth(self, api_key: str) -> None:
@@ -49,13 +92,196 @@ class GitHubCollector(BaseCollector):
         """
         self.session.headers['Authorization'] = f'token {api_key}'
     
+    def _with_token(self, headers: Optional[Dict[str, str]], token: str) -> Dict[str, str]:
+        """
+        Add a pooled token's Authorization header to the request headers.
+        
+        Args:
+            headers: Per-request headers
+            token: Token taken from the pool
+            
+        Returns:
+            Request headers authenticated with the token
+        """
+        request_headers = dict(headers or {})
+        request_headers['Authorization'] = f'token {token}'
+        return request_headers
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        **kwargs: Any
+    ) -> Any:
+        """
+        Send a request, rotating tokens when a token pool is configured.
+        
+        A token is only taken once the request actually goes out, so cached
+        responses never wait on an exhausted pool. When a token turns out to
+        be exhausted the pool parks it and the request is retried with the
+        next one, so one token's limit does not hold up the others.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: Query parameters
+            headers: Per-request headers
+            **kwargs: Additional arguments for BaseCollector._send
+            
+        Returns:
+            requests or httpx response object
+        """
+        if self.token_pool is None:
+            return super()._send(method, url, params, headers, **kwargs)
+        
+        for _ in range(len(self.token_pool)):
+            token = self.token_pool.acquire()
+            response = super()._send(method, url, params, self._with_token(headers, token), **kwargs)
+            self.token_pool.update(token, response.headers)
+            if not self._is_token_exhausted(response):
+                break
+        return response
+    
+    async def _send_async(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        **kwargs: Any
+    ) -> Any:
+        """
+        Send an async request, rotating and retrying tokens like _send.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: Query parameters
+            headers: Per-request headers
+            **kwargs: Additional arguments for BaseCollector._send_async
+            
+        Returns:
+            httpx response object
+        """
+        if self.token_pool is None:
+            return await super()._send_async(method, url, params, headers, **kwargs)
+        
+        for _ in range(len(self.token_pool)):
+            token = self.token_pool.acquire()
+            response = await super()._send_async(
+                method, url, params, self._with_token(headers, token), **kwargs
+            )
+            self.token_pool.update(token, response.headers)
+            if not self._is_token_exhausted(response):
+                break
+        return response
+    
+    @staticmethod
+    def _is_token_exhausted(response: Any) -> bool:
+        """
+        Check whether the token's primary rate limit rejected the request.
+        
+        Secondary limits (sent with ``Retry-After``) apply across tokens
+        and are not counted.
+        
+        Args:
+            response: requests or httpx response object
+            
+        Returns:
+            True if another token may still serve the request
+        """
+        headers = response.headers
+        return (
+            response.status_code in (403, 429)
+            and headers.get('X-RateLimit-Remaining') == '0'
+            and 'Retry-After' not in headers
+        )
+    
+    def _handle_response(self, response: Any) -> None:
+        """
+        Handle HTTP response and raise appropriate errors.
+        
+        With a token pool, an exhausted token is not a reason to pause every
+        worker: the pool has parked it (and every other token already
+        tried), and the next acquire() waits only for the earliest reset.
+        
+        Args:
+            response: requests or httpx response object
+            
+        Raises:
+            requests.HTTPError: For HTTP error status codes
+        """
+        if self.token_pool is not None and self._is_token_exhausted(response):
+            self.logger.warning("Rate limit exceeded on every pooled token")
+            raise requests.HTTPError(
+                f"Rate limit exceeded: {response.status_code}", response=response
+            )
+        super()._handle_response(response)
+    
+    def _update_pacing(self, headers: Any) -> None:
+        """
+        Derive request pacing from rate-limit headers.
+        
+        With a token pool the headers describe only the token that was
+        used, and the pool already parks exhausted tokens, so the shared
+        pacing is left to the token buckets.
+        
+        Args:
+            headers: Response headers
+        """
+        if self.token_pool is None:
+            super()._update_pacing(headers)
+    
+    def iter_user_repos(
+        self,
+        username: str,
+        include_private: bool = False,
+        per_page: int = 100,
+        sort: str = 'updated',
+        direction: str = 'desc',
+        refresh: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over repositories for a GitHub user, one page at a time.
+        
+        Only the page being consumed is held in memory.
+        
+        Args:
+            username: GitHub username
+            include_private: Include private repos (requires auth)
+            per_page: Number of results per page (max 100)
+            sort: Sort field (created, updated, pushed, full_name)
+            direction: Sort direction (asc, desc)
+            refresh: Bypass the response cache
+            
+        Yields:
+            Repository data dictionaries
+        """
+        self.logger.info("Collecting repositories for user: %s", username)
+        
+        params = {
+            'per_page': min(per_page, 100),
+            'sort': sort,
+            'direction': direction,
+            'type': 'all' if include_private else 'public'
+        }
+        count = 0
+        for items in self._iter_pages(f'/users/{username}/repos', params, 'repos', refresh):
+            count += len(items)
+            yield from items
+        
+        self.logger.info("Total repositories collected: %d", count)
+    
     def collect_user_repos(
         self,
         username: str,
         include_private: bool = False,
         per_page: int = 100,
         sort: str = 'updated',
-        direction: str = 'desc'
+        direction: str = 'desc',
+        refresh: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Collect repositories for a GitHub user.
@@ -66,56 +292,56 @@ class GitHubCollector(BaseCollector):
             per_page: Number of results per page (max 100)
             sort: Sort field (created, updated, pushed, full_name)
             direction: Sort direction (asc, desc)
+            refresh: Bypass the response cache
             
         Returns:
             List of repository data dictionaries
         """
-        self.logger.info(f"Collecting repositories for user: {username}")
-        
-        all_repos = []
-        page = 1
+        return list(self.iter_user_repos(
+            username, include_private, per_page, sort, direction, refresh
+        ))
+    
+    def iter_repo_issues(
+        self,
+        owner: str,
+        repo: str,
+        state: str = 'all',
+        per_page: int = 100,
+        refresh: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over issues for a repository, one page at a time.
         
-        while True:
-            params = {
-                'per_page': min(per_page, 100),
-                'page': page,
-                'sort': sort,
-                'direction': direction,
-                'type': 'all' if include_private else 'public'
-            }
+        Args:
+            owner: Repository owner username
+            repo: Repository name
+            state: Issue state (open, closed, all)
+            per_page: Number of results per page (max 100)
+            refresh: Bypass the response cache
             
-            try:
-                response = self._make_request(
-                    f'/users/{username}/repos',
-                    params=params
-                )
-                repos = response.json()
-                
-                if not repos:
-                    break
-                
-                all_repos.extend(repos)
-                self.logger.debug(f"Collected {len(repos)} repos from page {page}")
-                
-                # Check if there are more pages
-                if len(repos) < per_page:
-                    break
-                
-                page += 1
-                
-            except Exception as e:
-                self._handle_errors(e)
-                break
+        Yields:
+            Issue data dictionaries
+        """
+        self.logger.info("Collecting issues for %s/%s", owner, repo)
         
-        self.logger.info(f"Total repositories collected: {len(all_repos)}")
-        return all_repos
+        params = {
+            'state': state,
+            'per_page': min(per_page, 100)
+        }
+        count = 0
+        for items in self._iter_pages(f'/repos/{owner}/{repo}/issues', params, 'issues', refresh):
+            count += len(items)
+            yield from items
+        
+        self.logger.info("Total issues collected: %d", count)
     
     def collect_repo_issues(
         self,
         owner: str,
         repo: str,
         state: str = 'all',
-        per_page: int = 100
+        per_page: int = 100,
+        refresh: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Collect issues for a repository.
@@ -125,53 +351,54 @@ class GitHubCollector(BaseCollector):
             repo: Repository name
             state: Issue state (open, closed, all)
             per_page: Number of results per page (max 100)
+            refresh: Bypass the response cache
             
         Returns:
             List of issue data dictionaries
         """
-        self.logger.info(f"Collecting issues for {owner}/{repo}")
-        
-        all_issues = []
-        page = 1
+        return list(self.iter_repo_issues(owner, repo, state, per_page, refresh))
+    
+    def iter_pull_requests(
+        self,
+        owner: str,
+        repo: str,
+        state: str = 'all',
+        per_page: int = 100,
+        refresh: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over pull requests for a repository, one page at a time.
         
-        while True:
-            params = {
-                'state': state,
-                'per_page': min(per_page, 100),
-                'page': page
-            }
+        Args:
+            owner: Repository owner username
+            repo: Repository name
+            state: PR state (open, closed, all)
+            per_page: Number of results per page (max 100)
+            refresh: Bypass the response cache
             
-            try:
-                response = self._make_request(
-                    f'/repos/{owner}/{repo}/issues',
-                    params=params
-                )
-                issues = response.json()
-                
-                if not issues:
-                    break
-                
-                all_issues.extend(issues)
-                self.logger.debug(f"Collected {len(issues)} issues from page {page}")
-                
-                if len(issues) < per_page:
-                    break
-                
-                page += 1
-                
-            except Exception as e:
-                self._handle_errors(e)
-                break
+        Yields:
+            Pull request data dictionaries
+        """
+        self.logger.info("Collecting pull requests for %s/%s", owner, repo)
         
-        self.logger.info(f"Total issues collected: {len(all_issues)}")
-        return all_issues
+        params = {
+            'state': state,
+            'per_page': min(per_page, 100)
+        }
+        count = 0
+        for items in self._iter_pages(f'/repos/{owner}/{repo}/pulls', params, 'PRs', refresh):
+            count += len(items)
+            yield from items
+        
+        self.logger.info("Total pull requests collected: %d", count)
     
     def collect_pull_requests(
         self,
         owner: str,
         repo: str,
         state: str = 'all',
-        per_page: int = 100
+        per_page: int = 100,
+        refresh: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Collect pull requests for a repository.
@@ -181,68 +408,136 @@ class GitHubCollector(BaseCollector):
             repo: Repository name
             state: PR state (open, closed, all)
             per_page: Number of results per page (max 100)
+            refresh: Bypass the response cache
             
         Returns:
             List of pull request data dictionaries
         """
-        self.logger.info(f"Collecting pull requests for {owner}/{repo}")
-        
-        all_prs = []
-        page = 1
-        
-        while True:
-            params = {
-                'state': state,
-                'per_page': min(per_page, 100),
-                'page': page
-            }
-            
-            try:
-                response = self._make_request(
-                    f'/repos/{owner}/{repo}/pulls',
-                    params=params
-                )
-                prs = response.json()
-                
-                if not prs:
-                    break
-                
-                all_prs.extend(prs)
-                self.logger.debug(f"Collected {len(prs)} PRs from page {page}")
-                
-                if len(prs) < per_page:
-                    break
-                
-                page += 1
-                
-            except Exception as e:
-                self._handle_errors(e)
-                break
-        
-        self.logger.info(f"Total pull requests collected: {len(all_prs)}")
-        return all_prs
+        return list(self.iter_pull_requests(owner, repo, state, per_page, refresh))
     
-    def collect_user_profile(self, username: str) -> Dict[str, Any]:
+    def collect_user_profile(self, username: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Collect user profile information.
         
         Args:
             username: GitHub username
+            refresh: Bypass the response cache
             
         Returns:
             User profile data dictionary
         """
-        self.logger.info(f"Collecting profile for user: {username}")
+        self.logger.info("Collecting profile for user: %s", username)
         
         try:
-            response = self._make_request(f'/users/{username}')
-            profile = response.json()
-            self.logger.info(f"Profile collected for {username}")
+            response = self._make_request(
+                f'/users/{username}',
+                cache_ttl=self.PROFILE_CACHE_TTL,
+                refresh=refresh
+            )
+            profile = _json(response)
+            self.logger.info("Profile collected for %s", username)
             return profile
         except Exception as e:
             self._handle_errors(e)
             return {}
     
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        label: str,
+        refresh: bool = False
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over every page of a paginated list endpoint.
+        
+        The first page is fetched on its own. If GitHub advertises the last
+        page through the ``Link`` header, the remaining pages are fetched
+        concurrently and merged in page order; otherwise pages are walked
+        sequentially while the ``Link`` header has a ``rel="next"`` entry.
+        Stopping on the header avoids requesting an empty page when the
+        item count is an exact multiple of ``per_page``. Errors are logged
+        and end the iteration, so pages already yielded are kept.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (without ``page``)
+            label: Item label used in log messages
+            refresh: Bypass the response cache
+            
+        Yields:
+            List of items on each page, in page order
+        """
+        page = 1
+        # Bound once; both are looked up for every page
+        log_debug = self.logger.debug
+        make_request = self._make_request
+        
+        try:
+            response = make_request(
+                endpoint,
+                params={**params, 'page': page},
+                refresh=refresh
+            )
+            items = _json(response)
+            log_debug("Collected %d %s from page %d", len(items), label, page)
+            yield items
+            
+            last_page = self._get_last_page(response)
+            if last_page is not None:
+                # Fetch max_workers pages per batch so at most one batch of
+                # pages is held while the consumer catches up
+                for pages in batched(range(2, last_page + 1), self.max_workers):
+                    responses = self._make_requests_batch([
+                        {'endpoint': endpoint, 'params': {**params, 'page': page}, 'refresh': refresh}
+                        for page in pages
+                    ])
+                    for page, page_response in zip(pages, responses):
+                        items = _json(page_response)
+                        log_debug("Collected %d %s from page %d", len(items), label, page)
+                        yield items
+                return
+            
+            # No last page advertised: follow rel="next" sequentially
+            while 'next' in response.links:
+                page += 1
+                response = make_request(
+                    endpoint,
+                    params={**params, 'page': page},
+                    refresh=refresh
+                )
+                items = _json(response)
+                log_debug("Collected %d %s from page %d", len(items), label, page)
+                yield items
+                
+        except Exception as e:
+            self._handle_errors(e)
+    
+    @staticmethod
+    def _get_last_page(response: requests.Response) -> Optional[int]:
+        """
+        Read the last page number from the ``Link`` response header.
+        
+        Args:
+            response: Response for the first page
+            
+        Returns:
+            Last page number, or None if the header is absent
+        """
+        last = response.links.get('last')
+        if not last:
+            return None
+        
+        page_values = parse_qs(urlparse(last.get('url', '')).query).get('page')
+        if not page_values:
+            return None
+        
+        try:
+            return int(page_values[0])
+        except ValueError:
+            return None
+    
+    @memoized_collect()
     def collect(self, collection_type: str, **kwargs) -> Any:
         """
         Generic collect method that routes to specific collection methods.
@@ -0,0 +1,268 @@
+"""
+GitHub GraphQL API data collector
+"""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import requests
+from ..core.base_collector import BaseCollector, _json, memoized_collect
+
+
+REPOS_QUERY = """
+query($login: String!, $first: Int!, $after: String, $privacy: RepositoryPrivacy,
+      $orderBy: RepositoryOrder) {
+  rateLimit { cost remaining resetAt }
+  user(login: $login) {
+    repositories(first: $first, after: $after, privacy: $privacy, orderBy: $orderBy) {
+      nodes {
+        databaseId
+        name
+        nameWithOwner
+        description
+        url
+        isPrivate
+        isFork
+        createdAt
+        updatedAt
+        pushedAt
+        stargazerCount
+        forkCount
+        primaryLanguage { name }
+        defaultBranchRef { name }
+        watchers { totalCount }
+        issues(states: OPEN) { totalCount }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+      }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+# REST sort field -> GraphQL RepositoryOrderField
+SORT_FIELDS = {
+    'created': 'CREATED_AT',
+    'updated': 'UPDATED_AT',
+    'pushed': 'PUSHED_AT',
+    'full_name': 'NAME'
+}
+
+
+class GitHubGraphQLCollector(BaseCollector):
+    """
+    Collector for the GitHub GraphQL API.
+    
+    Fetches up to 100 repositories, with nested language, topic and
+    counter data, per request. Results use the same shape as the REST
+    API so GitHubParser can be used unchanged.
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        rate_limit_delay: float = 0.5,
+        max_retries: int = 3,
+        min_remaining: int = 100,
+        http2: bool = False,
+        memoize: bool = False
+    ):
+        """
+        Initialize GitHub GraphQL collector.
+        
+        Args:
+            api_key: GitHub personal access token (required by the GraphQL API)
+            rate_limit_delay: Delay between requests
+            max_retries: Maximum retry attempts
+            min_remaining: Pause until the rate limit resets below this many points
+            http2: Send queries over HTTP/2 (requires ``httpx[http2]``)
+            memoize: Keep ``collect`` results in memory for five minutes
+        """
+        super().__init__(
+            base_url="https://api.github.com",
+            api_key=api_key,
+            rate_limit_delay=rate_limit_delay,
+            max_retries=max_retries,
+            http2=http2,
+            memoize=memoize
+        )
+        self.min_remaining = min_remaining
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    def _set_auth(self, api_key: str) -> None:
+        """
+        Set GitHub authentication using token.
+        
+        Args:
+            api_key: GitHub personal access token
+        """
+        self.session.headers['Authorization'] = f'bearer {api_key}'
+    
+    def _query(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a GraphQL query.
+        
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+            
+        Returns:
+            The ``data`` object of the response
+            
+        Raises:
+            requests.HTTPError: If the response contains GraphQL errors
+        """
+        response = self._make_request(
+            '/graphql',
+            method='POST',
+            json={'query': query, 'variables': variables}
+        )
+        payload = _json(response)
+        
+        if payload.get('errors'):
+            messages = '; '.join(error.get('message', '') for error in payload['errors'])
+            raise requests.HTTPError(f"GraphQL query failed: {messages}")
+        
+        data = payload.get('data') or {}
+        self._check_rate_limit(data.get('rateLimit'))
+        return data
+    
+    def _check_rate_limit(self, rate_limit: Optional[Dict[str, Any]]) -> None:
+        """
+        Back off until the reset time when the point budget runs low.
+        
+        Args:
+            rate_limit: ``rateLimit`` object returned by the query
+        """
+        if not rate_limit:
+            return
+        
+        remaining = rate_limit.get('remaining', self.min_remaining)
+        self.logger.debug(
+            "GraphQL query cost %s, %s points remaining", rate_limit.get('cost'), remaining
+        )
+        if remaining >= self.min_remaining or not rate_limit.get('resetAt'):
+            return
+        
+        reset_at = datetime.fromisoformat(rate_limit['resetAt'].replace('Z', '+00:00'))
+        wait = (reset_at - datetime.now(timezone.utc)).total_seconds()
+        if wait > 0:
+            self.logger.warning("GraphQL rate limit low (%s). Waiting %.0f seconds", remaining, wait)
+            time.sleep(wait)
+    
+    def collect_user_repos(
+        self,
+        username: str,
+        include_private: bool = False,
+        per_page: int = 100,
+        sort: str = 'updated',
+        direction: str = 'desc'
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect repositories for a GitHub user.
+        
+        Args:
+            username: GitHub username
+            include_private: Include private repos (requires auth)
+            per_page: Number of results per query (max 100)
+            sort: Sort field (created, updated, pushed, full_name)
+            direction: Sort direction (asc, desc)
+            
+        Returns:
+            List of repository data dictionaries in REST API shape
+        """
+        self.logger.info("Collecting repositories for user via GraphQL: %s", username)
+        
+        variables = {
+            'login': username,
+            'first': min(per_page, 100),
+            'after': None,
+            'privacy': None if include_private else 'PUBLIC',
+            'orderBy': {
+                'field': SORT_FIELDS.get(sort, 'UPDATED_AT'),
+                'direction': direction.upper()
+            }
+        }
+        all_repos = []
+        log_debug = self.logger.debug
+        query = self._query
+        to_rest_repo = self._to_rest_repo
+        
+        while True:
+            try:
+                data = query(REPOS_QUERY, variables)
+                user = data.get('user')
+                if not user:
+                    break
+                
+                connection = user['repositories']
+                repos = [to_rest_repo(node) for node in connection['nodes'] if node]
+                all_repos.extend(repos)
+                log_debug("Collected %d repos", len(repos))
+                
+                page_info = connection['pageInfo']
+                if not page_info.get('hasNextPage'):
+                    break
+                
+                variables['after'] = page_info.get('endCursor')
+            
+            except Exception as e:
+                self._handle_errors(e)
+                break
+        
+        self.logger.info("Total repositories collected: %d", len(all_repos))
+        return all_repos
+    
+    @staticmethod
+    def _to_rest_repo(node: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a GraphQL repository node to the REST API shape.
+        
+        Args:
+            node: GraphQL repository node
+            
+        Returns:
+            Repository dictionary with REST field names
+        """
+        url = node.get('url')
+        language = node.get('primaryLanguage') or {}
+        default_branch = node.get('defaultBranchRef') or {}
+        topics = (node.get('repositoryTopics') or {}).get('nodes', [])
+        
+        return {
+            'id': node.get('databaseId'),
+            'name': node.get('name'),
+            'full_name': node.get('nameWithOwner'),
+            'description': node.get('description'),
+            'html_url': url,
+            'clone_url': f"{url}.git" if url else None,
+            'language': language.get('name'),
+            'stargazers_count': node.get('stargazerCount', 0),
+            'forks_count': node.get('forkCount', 0),
+            'watchers_count': (node.get('watchers') or {}).get('totalCount', 0),
+            'open_issues_count': (node.get('issues') or {}).get('totalCount', 0),
+            'private': node.get('isPrivate', False),
+            'fork': node.get('isFork', False),
+            'created_at': node.get('createdAt'),
+            'updated_at': node.get('updatedAt'),
+            'pushed_at': node.get('pushedAt'),
+            'default_branch': default_branch.get('name', 'main'),
+            'topics': [topic['topic']['name'] for topic in topics if topic.get('topic')]
+        }
+    
+    @memoized_collect()
+    def collect(self, collection_type: str, **kwargs) -> Any:
+        """
+        Generic collect method that routes to specific collection methods.
+        
+        Args:
+            collection_type: Type of collection (repos)
+            **kwargs: Parameters for specific collection method
+            
+        Returns:
+            Collected data
+        """
+        if collection_type == 'repos':
+            return self.collect_user_repos(**kwargs)
+        raise ValueError(f"Unknown collection type: {collection_type}")
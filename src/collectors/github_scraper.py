@@ -2,13 +2,91 @@
 GitHub Trending Scraper
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 
 from ..core.base_collector import BaseCollector
+from ..utils.cache import ApiCache
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    etree = lxml_html = None
+
+# CSS selectors for the trending page, compiled once instead of per row
+SEL_ROW = soupsieve.compile('article.Box-row')
+SEL_TITLE = soupsieve.compile('h2.h3 a')
+SEL_DESCRIPTION = soupsieve.compile('p.col-9')
+SEL_STATS = soupsieve.compile('div.f6')
+SEL_LANGUAGE = soupsieve.compile('span[itemprop="programmingLanguage"]')
+SEL_STARS = soupsieve.compile('a[href$="/stargazers"]')
+SEL_FORKS = soupsieve.compile('a[href$="/forks"]')
+SEL_STARS_SINCE = soupsieve.compile('span.d-inline-block.float-sm-right')
+
+_COMMA_STRIP = str.maketrans('', '', ',')
+
+# Counts render as "1234", "1,234" or abbreviated as "12.3k" / "1.2m"
+_COUNT_RE = re.compile(r'(\d+(?:\.\d+)?)([km]?)')
+_COUNT_MULTIPLIERS = {'': 1, 'k': 1_000, 'm': 1_000_000}
+
+# User-Agent strings sampled once per process; fake_useragent loads its
+# database on construction, so it is never built per scraper or per call
+_UA_SAMPLE_SIZE = 32
+_user_agents: Optional[List[str]] = None
+_user_agents_lock = threading.Lock()
+
+
+def _random_user_agent() -> str:
+    """Pick a random User-Agent from the lazily built process-wide sample."""
+    global _user_agents
+    if _user_agents is None:
+        with _user_agents_lock:
+            if _user_agents is None:
+                ua = UserAgent()
+                _user_agents = [ua.random for _ in range(_UA_SAMPLE_SIZE)]
+    return random.choice(_user_agents)
+
+
+def _has_class(name: str) -> str:
+    """Build an XPath predicate matching a single CSS class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _href_endswith(suffix: str) -> str:
+    """Build an XPath predicate matching an href suffix."""
+    return f"substring(@href, string-length(@href) - {len(suffix) - 1}) = '{suffix}'"
+
+
+if etree is not None:
+    # Compiled once and evaluated per row, mirroring the CSS selectors above
+    XP_ROW = etree.XPath(f"//article[{_has_class('Box-row')}]")
+    XP_TITLE_HREF = etree.XPath(f"(.//h2[{_has_class('h3')}]//a)[1]/@href")
+    XP_DESCRIPTION = etree.XPath(f"(.//p[{_has_class('col-9')}])[1]")
+    XP_STATS = etree.XPath(f"(.//div[{_has_class('f6')}])[1]")
+    XP_LANGUAGE = etree.XPath("(.//span[@itemprop='programmingLanguage'])[1]")
+    XP_STARS = etree.XPath(f"(.//a[{_href_endswith('/stargazers')}])[1]")
+    XP_FORKS = etree.XPath(f"(.//a[{_href_endswith('/forks')}])[1]")
+    XP_STARS_SINCE = etree.XPath(
+        f"(.//span[{_has_class('d-inline-block')} and {_has_class('float-sm-right')}])[1]"
+    )
+
+
+def _parse_count(text: str) -> int:
+    """Parse a count such as '1,234' or '12.3k', returning 0 for anything else."""
+    match = _COUNT_RE.fullmatch(text.strip().translate(_COMMA_STRIP).lower())
+    if not match:
+        return 0
+    number, suffix = match.groups()
+    return round(float(number) * _COUNT_MULTIPLIERS[suffix])
 
 
 class GitHubScraper(BaseCollector):
@@ -19,10 +97,14 @@ class GitHubScraper(BaseCollector):
     - Trending repositories by language
     """
     
+    # Trending pages change quickly; keep cached copies briefly
+    TRENDING_CACHE_TTL = 5 * 60
+    
     def __init__(
         self, 
         rate_limit_delay: float = 1.0, 
-        max_retries: int = 3
+        max_retries: int = 3,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize GitHub scraper.
@@ -30,20 +112,22 @@ class GitHubScraper(BaseCollector):
         Args:
             rate_limit_delay: Delay between requests
             max_retries: Maximum retry attempts
+            cache_dir: Directory for the TTL response cache; enables caching
         """
         super().__init__(
             base_url="https://github.com",
             api_key=None,  # No API key needed for scraping
             rate_limit_delay=rate_limit_delay,
-            max_retries=max_retries
+            max_retries=max_retries,
+            cache=ApiCache(cache_dir, default_ttl=self.TRENDING_CACHE_TTL) if cache_dir else None
         )
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.ua = UserAgent()
     
     def collect_trending(
         self,
         language: str = '',
-        since: str = 'daily'
+        since: str = 'daily',
+        refresh: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Collect trending repositories.
@@ -51,11 +135,12 @@ class GitHubScraper(BaseCollector):
         Args:
             language: Programming language (e.g., 'python', 'javascript')
             since: Time range ('daily', 'weekly', 'monthly')
+            refresh: Bypass the response cache
             
         Returns:
             List of trending repository dictionaries
         """
-        self.logger.info(f"Collecting trending repos for language: '{language}' since: '{since}'")
+        self.logger.info("Collecting trending repos for language: '%s' since: '%s'", language, since)
         
         params = {}
         if since != 'daily':
@@ -66,13 +151,14 @@ class GitHubScraper(BaseCollector):
             url_path = f'trending/{language}'
             
         # Randomize User-Agent to avoid blocking
-        headers = {'User-Agent': self.ua.random}
+        headers = {'User-Agent': _random_user_agent()}
         
         try:
             response = self._make_request(
                 url_path,
                 params=params,
-                headers=headers
+                headers=headers,
+                refresh=refresh
             )
             
             return self._parse_trending_page(response.text)
@@ -81,6 +167,57 @@ class GitHubScraper(BaseCollector):
             self._handle_errors(e)
             return []
     
+    async def collect_trending_async(
+        self,
+        languages: Sequence[str],
+        since: str = 'daily',
+        refresh: bool = False,
+        max_concurrency: int = 10
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Collect trending repositories for several languages concurrently.
+        
+        Each language is fetched and parsed on a worker thread so the shared
+        session, retries, cache and rate limiting all still apply.
+        
+        Args:
+            languages: Programming languages ('' for all languages)
+            since: Time range ('daily', 'weekly', 'monthly')
+            refresh: Bypass the response cache
+            max_concurrency: Maximum number of pages in flight
+            
+        Returns:
+            Dictionary mapping each language to its trending repositories
+        """
+        loop = asyncio.get_running_loop()
+        
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(executor, self.collect_trending, language, since, refresh)
+                for language in languages
+            ])
+        
+        return dict(zip(languages, results))
+    
+    def collect_trending_multi(
+        self,
+        languages: Sequence[str],
+        since: str = 'daily',
+        refresh: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Synchronous wrapper around collect_trending_async.
+        
+        Args:
+            languages: Programming languages ('' for all languages)
+            since: Time range ('daily', 'weekly', 'monthly')
+            refresh: Bypass the response cache
+            
+        Returns:
+            Dictionary mapping each language to its trending repositories
+        """
+        return asyncio.run(self.collect_trending_async(languages, since, refresh))
+    
     def _parse_trending_page(self, html_content: str) -> List[Dict[str, Any]]:
         """
         Parse GitHub trending HTML page.
@@ -91,75 +228,162 @@ class GitHubScraper(BaseCollector):
         Returns:
             List of parsed repository data
         """
+        if lxml_html is not None:
+            return self._parse_trending_page_lxml(html_content)
+        
+        # Only reached without lxml, so use the pure-Python parser
         soup = BeautifulSoup(html_content, 'html.parser')
         repos = []
         
         # GitHub trending structure changes often, but generally uses <article> or .Box-row
-        repo_rows = soup.select('article.Box-row')
+        repo_rows = SEL_ROW.select(soup)
+        parse_row = self._parse_trending_row
         
         for row in repo_rows:
             try:
-                # Name and User
-                title_h1 = row.select_one('h2.h3 a')
-                if not title_h1:
-                    continue
-                    
-                full_name = title_h1.get('href', '').strip('/')
-                parts = full_name.split('/')
-                owner = parts[0] if len(parts) > 0 else ''
-                name = parts[1] if len(parts) > 1 else ''
-                
-                # Description
-                desc_p = row.select_one('p.col-9')
-                description = desc_p.text.strip() if desc_p else ''
-                
-                # Stats (Stars, Forks)
-                stats_div = row.select_one('div.f6')
-                language_span = stats_div.select_one('span[itemprop="programmingLanguage"]')
-                language = language_span.text.strip() if language_span else 'Unknown'
-                
-                # Stars are usually the first link in the stats div
-                stars_link = stats_div.select_one('a[href$="/stargazers"]')
-                stars_text = stars_link.text.strip().replace(',', '') if stars_link else '0'
-                try:
-                    stars = int(stars_text)
-                except ValueError:
-                    stars = 0
-                
-                # Fork count
-                forks_link = stats_div.select_one('a[href$="/forks"]')
-                forks_text = forks_link.text.strip().replace(',', '') if forks_link else '0'
-                try:
-                    forks = int(forks_text)
-                except ValueError:
-                    forks = 0
-                
-                # Stars today/this week/month
-                stars_today_span = stats_div.select_one('span.d-inline-block.float-sm-right')
-                stars_today_text = stars_today_span.text.strip().split()[0].replace(',', '') if stars_today_span else '0'
-                try:
-                    stars_since = int(stars_today_text)
-                except ValueError:
-                    stars_since = 0
-
-                repos.append({
-                    'full_name': full_name,
-                    'owner': owner,
-                    'name': name,
-                    'description': description,
-                    'language': language,
-                    'stars_total': stars,
-                    'forks_total': forks,
-                    'stars_since': stars_since,
-                    'url': f"https://github.com/{full_name}"
-                })
-                
+                repo = parse_row(row)
             except Exception as e:
-                self.logger.warning(f"Error parsing a trending row: {e}")
+                self.logger.warning("Error parsing a trending row: %s", e)
                 continue
+            
+            if repo:
+                repos.append(repo)
                 
-        self.logger.info(f"Parsed {len(repos)} trending repositories")
+        self.logger.info("Parsed %d trending repositories", len(repos))
         return repos
+    
+    def _parse_trending_page_lxml(self, html_content: str) -> List[Dict[str, Any]]:
+        """
+        Parse GitHub trending HTML page with precompiled XPath expressions.
+        
+        Args:
+            html_content: Raw HTML content
+            
+        Returns:
+            List of parsed repository data
+        """
+        repos = []
+        if not html_content or not html_content.strip():
+            self.logger.info("Parsed 0 trending repositories")
+            return repos
+        
+        tree = lxml_html.fromstring(html_content)
+        parse_row = self._parse_trending_row_lxml
+        
+        for row in XP_ROW(tree):
+            try:
+                repo = parse_row(row)
+            except Exception as e:
+                self.logger.warning("Error parsing a trending row: %s", e)
+                continue
+            
+            if repo:
+                repos.append(repo)
+        
+        self.logger.info("Parsed %d trending repositories", len(repos))
+        return repos
+    
+    def _parse_trending_row_lxml(self, row: Any) -> Optional[Dict[str, Any]]:
+        """
+        Parse a single trending repository row with XPath.
+        
+        Args:
+            row: lxml element for the row
+            
+        Returns:
+            Parsed repository data, or None if the row has no title link
+        """
+        hrefs = XP_TITLE_HREF(row)
+        if not hrefs:
+            return None
+        
+        full_name = hrefs[0].strip().strip('/')
+        parts = full_name.split('/')
+        owner = parts[0] if len(parts) > 0 else ''
+        name = parts[1] if len(parts) > 1 else ''
+        
+        desc = XP_DESCRIPTION(row)
+        description = desc[0].text_content().strip() if desc else ''
+        
+        stats = XP_STATS(row)[0]
+        language_span = XP_LANGUAGE(stats)
+        language = language_span[0].text_content().strip() if language_span else 'Unknown'
+        
+        stars_link = XP_STARS(stats)
+        stars = _parse_count(stars_link[0].text_content()) if stars_link else 0
+        
+        forks_link = XP_FORKS(stats)
+        forks = _parse_count(forks_link[0].text_content()) if forks_link else 0
+        
+        stars_since_span = XP_STARS_SINCE(stats)
+        stars_since_words = stars_since_span[0].text_content().split() if stars_since_span else []
+        stars_since = _parse_count(stars_since_words[0]) if stars_since_words else 0
+        
+        return {
+            'full_name': full_name,
+            'owner': owner,
+            'name': name,
+            'description': description,
+            'language': language,
+            'stars_total': stars,
+            'forks_total': forks,
+            'stars_since': stars_since,
+            'url': f"https://github.com/{full_name}"
+        }
+    
+    def _parse_trending_row(self, row: Any) -> Optional[Dict[str, Any]]:
+        """
+        Parse a single trending repository row.
+        
+        Args:
+            row: BeautifulSoup element for the row
+            
+        Returns:
+            Parsed repository data, or None if the row has no title link
+        """
+        # Name and User
+        title_h1 = SEL_TITLE.select_one(row)
+        if not title_h1:
+            return None
+            
+        full_name = title_h1.get('href', '').strip('/')
+        parts = full_name.split('/')
+        owner = parts[0] if len(parts) > 0 else ''
+        name = parts[1] if len(parts) > 1 else ''
+        
+        # Description
+        desc_p = SEL_DESCRIPTION.select_one(row)
+        description = desc_p.text.strip() if desc_p else ''
+        
+        # Stats (Stars, Forks)
+        stats_div = SEL_STATS.select_one(row)
+        language_span = SEL_LANGUAGE.select_one(stats_div)
+        language = language_span.text.strip() if language_span else 'Unknown'
+        
+        # Stars are usually the first link in the stats div
+        stars_link = SEL_STARS.select_one(stats_div)
+        stars = _parse_count(stars_link.text) if stars_link else 0
+        
+        # Fork count
+        forks_link = SEL_FORKS.select_one(stats_div)
+        forks = _parse_count(forks_link.text) if forks_link else 0
+        
+        # Stars today/this week/month
+        stars_today_span = SEL_STARS_SINCE.select_one(stats_div)
+        stars_today_words = stars_today_span.text.split() if stars_today_span else []
+        stars_since = _parse_count(stars_today_words[0]) if stars_today_words else 0
+        
+        return {
+            'full_name': full_name,
+            'owner': owner,
+            'name': name,
+            'description': description,
+            'language': language,
+            'stars_total': stars,
+            'forks_total': forks,
+            'stars_since': stars_since,
+            'url': f"https://github.com/{full_name}"
+        }
 
     def collect(self, collection_type: str, **kwargs) -> Any:
         """
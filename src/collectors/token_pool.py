@@ -0,0 +1,144 @@
+"""
+GitHub token rotation pool
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional
+
+
+def token_hash(token: str) -> str:
+    """
+    Get a short, log-safe identifier for a token.
+    
+    Args:
+        token: GitHub personal access token
+        
+    Returns:
+        First 12 hex characters of the token's SHA-256
+    """
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()[:12]
+
+
+@dataclass
+class TokenBudget:
+    """Rate-limit budget reported by GitHub for one token."""
+    token: str
+    remaining: Optional[int] = None  # Unknown until the first response
+    reset_at: float = 0.0  # Epoch seconds
+    
+    def is_parked(self, now: float) -> bool:
+        """Whether the token is exhausted until its reset time."""
+        return self.remaining == 0 and self.reset_at > now
+
+
+class TokenPool:
+    """
+    Pool of GitHub tokens used in rotation.
+    
+    Each request takes the token with the most remaining budget (tokens
+    without a known budget yet come first). Exhausted tokens are parked
+    until GitHub's reset time. Thread-safe.
+    """
+    
+    def __init__(self, tokens: List[str]):
+        """
+        Initialize the pool.
+        
+        Args:
+            tokens: GitHub personal access tokens
+            
+        Raises:
+            ValueError: If no tokens are given
+        """
+        unique_tokens = [token for token in dict.fromkeys(tokens) if token]
+        if not unique_tokens:
+            raise ValueError("TokenPool requires at least one token")
+        
+        self._budgets: Dict[str, TokenBudget] = {
+            token_hash(token): TokenBudget(token) for token in unique_tokens
+        }
+        self._order = deque(self._budgets)
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    def __len__(self) -> int:
+        return len(self._budgets)
+    
+    def acquire(self) -> str:
+        """
+        Pick the token to use for the next request.
+        
+        Sleeps until the earliest reset when every token is exhausted.
+        
+        Returns:
+            GitHub token
+        """
+        while True:
+            with self._lock:
+                now = time.time()
+                available = [
+                    key for key in self._order
+                    if not self._budgets[key].is_parked(now)
+                ]
+                
+                if available:
+                    # max() keeps the first of equal candidates; rotating the
+                    # chosen key to the back spreads ties round-robin
+                    key = max(available, key=self._priority)
+                    self._order.remove(key)
+                    self._order.append(key)
+                    return self._budgets[key].token
+                
+                wait = min(budget.reset_at for budget in self._budgets.values()) - now
+            
+            self.logger.warning("All %d tokens exhausted. Waiting %.0f seconds", len(self), wait)
+            time.sleep(max(wait, 0))
+    
+    def _priority(self, key: str) -> float:
+        """Sort key for token selection (unknown budgets first)."""
+        remaining = self._budgets[key].remaining
+        return float('inf') if remaining is None else remaining
+    
+    def update(self, token: str, headers: Mapping[str, str]) -> None:
+        """
+        Record the budget reported in response headers.
+        
+        Args:
+            token: Token used for the request
+            headers: Response headers
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        
+        key = token_hash(token)
+        with self._lock:
+            budget = self._budgets.get(key)
+            if budget is None:
+                return
+            try:
+                budget.remaining = int(remaining)
+                budget.reset_at = float(headers.get('X-RateLimit-Reset', 0))
+            except ValueError:
+                return
+        
+        if budget.remaining == 0:
+            self.logger.info("Token %s exhausted until %.0f", key, budget.reset_at)
+    
+    def budgets(self) -> Dict[str, TokenBudget]:
+        """
+        Get a snapshot of the per-token budgets.
+        
+        Returns:
+            Dictionary mapping token hashes to budgets
+        """
+        with self._lock:
+            return {
+                key: TokenBudget(budget.token, budget.remaining, budget.reset_at)
+                for key, budget in self._budgets.items()
+            }
@@ -2,25 +2,71 @@
 Application settings and configuration
 """
 
+import functools
 import os
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
 
+# load_dotenv() walks up the directory tree looking for .env; do it once per process
+_load_dotenv_once = functools.lru_cache(maxsize=1)(load_dotenv)
+
+
+@dataclass(frozen=True)
 class Settings:
     """
     Application settings loaded from environment variables.
+    
+    Instances are immutable snapshots; use ``Settings.from_env()`` or
+    ``get_settings()`` to build one.
     """
+    # Declared by hand rather than with slots=True to keep Python 3.8 support
+    __slots__ = (
+        'github_token',
+        'github_tokens',
+        'output_dir',
+        'log_level',
+        'rate_limit_delay',
+        'max_retries',
+        'etag_cache_path',
+        'cache_dir',
+        'http2'
+    )
+    
+    github_token: Optional[str]
+    github_tokens: Tuple[str, ...]
+    output_dir: str
+    log_level: str
+    rate_limit_delay: float
+    max_retries: int
+    etag_cache_path: Optional[str]
+    cache_dir: Optional[str]
+    http2: bool
     
-    def __init__(self):
-        """Load settings from environment."""
-        load_dotenv()
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """
+        Load settings from environment.
+        
+        Returns:
+            Settings instance
+        """
+        _load_dotenv_once()
         
-        self.github_token: Optional[str] = os.getenv('GITHUB_TOKEN')
-        self.output_dir: str = os.getenv('OUTPUT_DIR', 'output')
-        self.log_level: str = os.getenv('LOG_LEVEL', 'INFO')
-        self.rate_limit_delay: float = float(os.getenv('RATE_LIMIT_DELAY', '0.5'))
-        self.max_retries: int = int(os.getenv('MAX_RETRIES', '3'))
+        return cls(
+            github_token=os.getenv('GITHUB_TOKEN'),
+            github_tokens=tuple(
+                token.strip() for token in os.getenv('GITHUB_TOKENS', '').split(',') if token.strip()
+            ),
+            output_dir=os.getenv('OUTPUT_DIR', 'output'),
+            log_level=os.getenv('LOG_LEVEL', 'INFO'),
+            rate_limit_delay=float(os.getenv('RATE_LIMIT_DELAY', '0.5')),
+            max_retries=int(os.getenv('MAX_RETRIES', '3')),
+            etag_cache_path=os.getenv('ETAG_CACHE_PATH', '.cache/etags.sqlite') or None,
+            cache_dir=os.getenv('CACHE_DIR', '~/.api-collector-cache') or None,
+            http2=os.getenv('HTTP2', '').lower() in ('1', 'true', 'yes')
+        )
     
     def validate(self) -> bool:
         """
@@ -55,6 +101,6 @@ def get_settings() -> Settings:
     """
     global _settings
     if _settings is None:
-        _settings = Settings()
+        _settings = Settings.from_env()
         _settings.validate()
     return _settings
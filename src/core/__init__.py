@@ -2,8 +2,8 @@
 Core base classes for collectors, parsers, and exporters
 """
 
-from .base_collector import BaseCollector
+from .base_collector import BaseCollector, memoized_collect
 from .base_parser import BaseParser
 from .base_exporter import BaseExporter
 
-__all__ = ['BaseCollector', 'BaseParser', 'BaseExporter']
+__all__ = ['BaseCollector', 'BaseParser', 'BaseExporter', 'memoized_collect']
@@ -3,12 +3,125 @@ Base collector class for data collection
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from functools import partial, wraps
+import hashlib
+import threading
 import time
 import logging
-from typing import Any, Dict, Optional
+from types import TracebackType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, cast
+import weakref
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from ..utils.cache import ApiCache
+from ..utils.etag_store import CachedResponse, ETagStore
+from ..utils.rate_limiter import TokenBucket
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+T = TypeVar('T')
+F = TypeVar('F', bound=Callable[..., Any])
+
+# Below this share of the hourly quota, requests are spread over the time
+# left until the reset instead of being sent as fast as pacing allows
+LOW_BUDGET_FRACTION = 0.1
+
+
+def _json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    
+    orjson parses the raw bytes directly and is several times faster than
+    the stdlib decoder behind Response.json().
+    
+    Args:
+        response: Response object
+        
+    Returns:
+        Decoded JSON data
+    """
+    content = getattr(response, 'content', None)
+    if orjson is not None and isinstance(content, (bytes, bytearray)):
+        return orjson.loads(content)
+    return response.json()
+
+
+def memoized_collect(ttl: float = 300) -> Callable[[F], F]:
+    """
+    Memoize a collector's ``collect`` results in memory for ``ttl`` seconds.
+    
+    Only active on collectors built with ``memoize=True``. Results are kept
+    per collector instance and keyed on the call's arguments. Callers
+    always get a deep copy, so mutating a result never changes the memo.
+    Passing ``refresh=True`` skips the memo and stores the fresh result.
+    Calls with unhashable arguments are not memoized, and neither are empty
+    results or results of calls that handled an error, since collectors
+    return those as fallbacks on failure. Expired entries are dropped and
+    collected again through the HTTP layer, where the ETag store and
+    response cache still apply.
+    
+    Args:
+        ttl: Seconds a result stays valid
+        
+    Returns:
+        Decorator for a ``collect`` method
+    """
+    def decorator(func: F) -> F:
+        # collector -> {call key: (timestamp, result)}
+        memo: 'weakref.WeakKeyDictionary[Any, Dict[Any, Tuple[float, Any]]]' = weakref.WeakKeyDictionary()
+        lock = threading.Lock()
+        
+        @wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if not self.memoize:
+                return func(self, *args, **kwargs)
+            
+            try:
+                key = (args, frozenset(item for item in kwargs.items() if item[0] != 'refresh'))
+                hash(key)
+            except TypeError:
+                return func(self, *args, **kwargs)
+            
+            if not kwargs.get('refresh'):
+                with lock:
+                    entries = memo.get(self, {})
+                    entry = entries.get(key)
+                    if entry is not None and time.monotonic() - entry[0] >= ttl:
+                        del entries[key]
+                        entry = None
+                if entry is not None:
+                    return copy.deepcopy(entry[1])
+            
+            errors = self._error_count
+            result = func(self, *args, **kwargs)
+            if not result or self._error_count != errors:
+                return result
+            
+            with lock:
+                entries = memo.setdefault(self, {})
+                now = time.monotonic()
+                for stale in [k for k, (stamp, _) in entries.items() if now - stamp >= ttl]:
+                    del entries[stale]
+                entries[key] = (now, copy.deepcopy(result))
+            return result
+        
+        # Exposed for inspection, like functools.lru_cache's cache_info()
+        wrapper.memo = memo  # type: ignore[attr-defined]
+        return cast(F, wrapper)
+    
+    return decorator
 
 
 class BaseCollector(ABC):
@@ -25,7 +138,14 @@ class BaseCollector(ABC):
         api_key: Optional[str] = None,
         rate_limit_delay: float = 1.0,
         max_retries: int = 3,
-        timeout: int = 30
+        timeout: int = 30,
+        etag_store: Optional[ETagStore] = None,
+        cache: Optional[ApiCache] = None,
+        http2: bool = False,
+        rate_limits: Optional[Sequence[TokenBucket]] = None,
+        max_workers: int = 8,
+        memoize: bool = False,
+        concurrent_batches: int = 1
     ):
         """
         Initialize the base collector.
@@ -33,25 +153,69 @@ class BaseCollector(ABC):
         Args:
             base_url: Base URL for API requests
             api_key: Optional API key for authentication
-            rate_limit_delay: Delay between requests in seconds
+            rate_limit_delay: Delay between requests in seconds; builds the default
+                bucket (no bursts, one token every rate_limit_delay seconds)
             max_retries: Maximum number of retry attempts
             timeout: Request timeout in seconds
+            etag_store: Optional store enabling conditional GET requests
+            cache: Optional TTL cache for GET responses
+            http2: Send requests over HTTP/2 with httpx when it is installed
+            rate_limits: Token buckets that must all have a token before each
+                request, e.g. a per-minute and a per-hour bucket
+            max_workers: Maximum number of concurrent requests in a batch
+            memoize: Keep ``collect`` results in memory (see ``memoized_collect``)
+            concurrent_batches: Number of batches run at once on this collector,
+                used with max_workers to size the connection pool
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.etag_store = etag_store
+        self.cache = cache
+        self.memoize = memoize
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Configure session with retry strategy
+        # Cached responses are keyed by credential so no token sees data
+        # fetched with another one
+        self._cache_scope = self._credential_scope([api_key] if api_key else [])
+        
+        # Handled errors so far; memoized_collect skips results of failed calls
+        self._error_count = 0
+        
+        # Client-side limits; every bucket is thread-safe
+        if rate_limits is None:
+            rate_limits = [TokenBucket(1, 1 / rate_limit_delay)] if rate_limit_delay > 0 else []
+        self.rate_limits = list(rate_limits)
+        
+        # Server-side pacing derived from X-RateLimit-* headers, shared by all threads
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._budget_delay = 0.0
+        
+        # Configure a shared keep-alive session with retry strategy. The pool
+        # holds a connection for every request that can be in flight at once
+        # (max_workers for each concurrent batch), so connections and their
+        # TLS handshakes are reused instead of being discarded when it is full. Rate-limit
+        # rejections (403/429) are left to _handle_response, which pauses
+        # every worker instead of each connection backing off on its own.
         self.session = requests.Session()
         retry_strategy = Retry(
             total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            connect=max_retries,
+            read=max_retries,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=max_workers * concurrent_batches,
+            max_retries=retry_strategy
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -61,9 +225,181 @@ class BaseCollector(ABC):
             'Accept': 'application/json'
         })
         
+        # Optional HTTP/2 client; concurrent page fetches are multiplexed as
+        # streams over one connection instead of opening one connection each
+        self.client = self._build_http2_client() if http2 else None
+        
+        # Async clients are bound to an event loop, so each thread running
+        # one gets its own (see _run_async)
+        self._async_local = threading.local()
+        
         if api_key:
             self._set_auth(api_key)
     
+    def _build_http2_client(self) -> Optional['httpx.Client']:
+        """
+        Build the httpx client used for HTTP/2 requests.
+        
+        Returns:
+            httpx client, or None when httpx or h2 is not installed
+        """
+        if httpx is None:
+            self.logger.warning("httpx is not installed; falling back to HTTP/1.1")
+            return None
+        
+        try:
+            # Transport retries cover connection failures; status codes are
+            # handled by _handle_response
+            transport = httpx.HTTPTransport(http2=True, retries=self.max_retries)
+        except ImportError:
+            self.logger.warning("h2 is not installed; falling back to HTTP/1.1")
+            return None
+        
+        return httpx.Client(
+            transport=transport,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
+        )
+    
+    def _build_async_client(self) -> 'httpx.AsyncClient':
+        """
+        Build the httpx async client used by _make_request_async.
+        
+        Returns:
+            httpx async client, speaking HTTP/2 when h2 is installed
+        """
+        try:
+            transport = httpx.AsyncHTTPTransport(http2=True, retries=self.max_retries)
+        except ImportError:
+            transport = httpx.AsyncHTTPTransport(retries=self.max_retries)
+        
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        )
+    
+    def _get_async_client(self) -> 'httpx.AsyncClient':
+        """
+        Get this thread's async client, building it on first use.
+        
+        Returns:
+            httpx async client
+        """
+        client = getattr(self._async_local, 'client', None)
+        if client is None:
+            client = self._async_local.client = self._build_async_client()
+        return client
+    
+    async def _close_async_client(self) -> None:
+        """Close this thread's async client, if one was built."""
+        client = getattr(self._async_local, 'client', None)
+        if client is not None:
+            self._async_local.client = None
+            await client.aclose()
+    
+    def _run_async(self, awaitable: Awaitable[T]) -> T:
+        """
+        Run a coroutine to completion from synchronous code.
+        
+        The async client is closed afterwards because it cannot outlive
+        the event loop created here.
+        
+        Args:
+            awaitable: Coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        async def runner() -> T:
+            try:
+                return await awaitable
+            finally:
+                await self._close_async_client()
+        
+        return asyncio.run(runner())
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        **kwargs: Any
+    ) -> Any:
+        """
+        Send a request over the HTTP/2 client if configured, else the session.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: Query parameters
+            headers: Per-request headers; session defaults always apply
+            **kwargs: Additional arguments for the request
+            
+        Returns:
+            requests or httpx response object
+            
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        if self.client is None:
+            return self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+                **kwargs
+            )
+        
+        try:
+            return self.client.request(
+                method,
+                url,
+                params=params,
+                headers=self._client_headers(headers),
+                **kwargs
+            )
+        except httpx.TransportError as e:
+            # Surface transport errors the same way as the requests path
+            raise requests.ConnectionError(str(e)) from e
+    
+    async def _send_async(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        **kwargs: Any
+    ) -> Any:
+        """
+        Send a request over this thread's httpx.AsyncClient.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: Query parameters
+            headers: Per-request headers; session defaults always apply
+            **kwargs: Additional arguments for httpx
+            
+        Returns:
+            httpx response object
+            
+        Raises:
+            requests.ConnectionError: If the transport fails
+        """
+        try:
+            return await self._get_async_client().request(
+                method,
+                url,
+                params=params,
+                headers=self._client_headers(headers),
+                **kwargs
+            )
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+    
     def _set_auth(self, api_key: str) -> None:
         """
         Set authentication headers. Override in subclasses if needed.
@@ -79,7 +415,9 @@ class BaseCollector(ABC):
         method: str = 'GET',
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        **kwargs
+        cache_ttl: Optional[float] = None,
+        refresh: bool = False,
+        **kwargs: Any
     ) -> requests.Response:
         """
         Make an HTTP request with error handling and rate limiting.
@@ -89,6 +427,8 @@ class BaseCollector(ABC):
             method: HTTP method (GET, POST, etc.)
             params: Query parameters
             headers: Additional headers
+            cache_ttl: TTL for the response cache (defaults to the cache's TTL)
+            refresh: Bypass cached responses and fetch from the API
             **kwargs: Additional arguments for requests
             
         Returns:
@@ -99,58 +439,529 @@ class BaseCollector(ABC):
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
+        cached_response = self._lookup_cache(url, method, params, refresh)
+        if cached_response is not None:
+            return cached_response
+        
         # Apply rate limiting
         self._rate_limit()
         
-        # Merge headers
-        request_headers = self.session.headers.copy()
-        if headers:
-            request_headers.update(headers)
+        request_headers, cache_key, cached = self._prepare_headers(url, method, params, headers)
         
         try:
-            self.logger.debug(f"Making {method} request to {url}")
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                headers=request_headers,
-                timeout=self.timeout,
-                **kwargs
-            )
+            self.logger.debug("Making %s request to %s", method, url)
+            response: requests.Response = self._send(method, url, params, request_headers, **kwargs)
             
             # Handle response
+            self._update_pacing(response.headers)
             self._handle_response(response)
+            self._store_response(response, url, method, params, cache_key, cached, cache_ttl)
+            return response
             
+        except requests.RequestException as e:
+            self.logger.error("Request failed: %s", e)
+            raise
+    
+    async def _make_request_async(
+        self,
+        endpoint: str,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cache_ttl: Optional[float] = None,
+        refresh: bool = False,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Asynchronous counterpart of _make_request using httpx.AsyncClient.
+        
+        The client speaks HTTP/2 when h2 is installed, so concurrent calls
+        are multiplexed over one connection. Without httpx the synchronous
+        _make_request runs in the default executor instead.
+        
+        Args:
+            endpoint: API endpoint (relative to base_url)
+            method: HTTP method (GET, POST, etc.)
+            params: Query parameters
+            headers: Additional headers
+            cache_ttl: TTL for the response cache (defaults to the cache's TTL)
+            refresh: Bypass cached responses and fetch from the API
+            **kwargs: Additional arguments for httpx
+            
+        Returns:
+            Response object
+            
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        if httpx is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, partial(
+                self._make_request, endpoint, method, params, headers, cache_ttl, refresh, **kwargs
+            ))
+        
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        
+        cached_response = self._lookup_cache(url, method, params, refresh)
+        if cached_response is not None:
+            return cached_response
+        
+        wait = self._reserve_rate_limit()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        
+        request_headers, cache_key, cached = self._prepare_headers(url, method, params, headers)
+        
+        try:
+            self.logger.debug("Making async %s request to %s", method, url)
+            response = await self._send_async(method, url, params, request_headers, **kwargs)
+            
+            self._update_pacing(response.headers)
+            self._handle_response(response)
+            self._store_response(response, url, method, params, cache_key, cached, cache_ttl)
             return response
             
         except requests.RequestException as e:
-            self.logger.error(f"Request failed: {e}")
+            self.logger.error("Request failed: %s", e)
             raise
     
-    def _handle_response(self, response: requests.Response) -> None:
+    def _lookup_cache(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        refresh: bool
+    ) -> Optional[requests.Response]:
         """
-        Handle HTTP response and raise appropriate errors.
+        Look up a fresh TTL cache entry for a GET request.
+        
+        Args:
+            url: Request URL
+            method: HTTP method
+            params: Query parameters
+            refresh: Bypass the cache
+            
+        Returns:
+            Response replaying the cached entry, or None
+        """
+        if self.cache is None or refresh or method.upper() != 'GET':
+            return None
+        
+        cached_entry = self.cache.get(url, params, self._cache_scope)
+        if cached_entry is None:
+            return None
+        
+        self.logger.debug("Cache hit for %s", url)
+        return self._build_cached_response(url, cached_entry)
+    
+    def _prepare_headers(
+        self,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]]
+    ) -> Tuple[Optional[Dict[str, str]], Optional[str], Optional[CachedResponse]]:
+        """
+        Add the stored ETag, if any, to the per-request headers.
+        
+        Session headers are not copied in: requests merges them itself, and
+        the httpx paths merge them through ``_client_headers``.
+        
+        Args:
+            url: Request URL
+            method: HTTP method
+            params: Query parameters
+            headers: Additional headers
+            
+        Returns:
+            Tuple of (headers, ETag store key, stored response)
+        """
+        request_headers = headers
+        
+        # Conditional request: a 304 reply does not count against the rate limit
+        cache_key = None
+        cached = None
+        if self.etag_store is not None and method.upper() == 'GET':
+            cache_key = self.etag_store.make_key(url, params, self._cache_scope)
+            cached = self.etag_store.get(cache_key)
+            if cached:
+                request_headers = {**(headers or {}), 'If-None-Match': cached.etag}
+        
+        return request_headers, cache_key, cached
+    
+    def _client_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """
+        Merge session defaults into request headers for the httpx clients.
+        
+        Args:
+            headers: Per-request headers
+            
+        Returns:
+            Complete request headers
+        """
+        merged = dict(self.session.headers)
+        if headers:
+            merged.update(headers)
+        return merged
+    
+    def _store_response(
+        self,
+        response: Any,
+        url: str,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        cache_key: Optional[str],
+        cached: Optional[CachedResponse],
+        cache_ttl: Optional[float]
+    ) -> None:
+        """
+        Update the ETag store and the TTL cache from a successful response.
         
         Args:
             response: Response object
+            url: Request URL
+            method: HTTP method
+            params: Query parameters
+            cache_key: ETag store key, or None when ETags are disabled
+            cached: Stored response for the key, if any
+            cache_ttl: TTL for the response cache
+        """
+        if cache_key is not None:
+            self._apply_etag_cache(response, cache_key, cached)
+        
+        if self.cache is not None and method.upper() == 'GET' and not self._is_no_store(response):
+            self.cache.set(url, params, {
+                'body': response.text,
+                'link': response.headers.get('Link')
+            }, ttl=cache_ttl, scope=self._cache_scope)
+    
+    def _make_requests_batch(
+        self,
+        specs: Sequence[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[requests.Response]:
+        """
+        Make several requests concurrently.
+        
+        With HTTP/2 enabled the requests run as coroutines over one
+        multiplexed connection (see _make_requests_batch_async); otherwise
+        they run on a thread pool sharing the session. Caching, ETags and
+        rate limiting apply per request either way.
+        
+        Args:
+            specs: Keyword arguments for _make_request, one dict per request
+            max_workers: Maximum concurrent requests (defaults to self.max_workers)
+            
+        Returns:
+            Responses in the same order as specs
+            
+        Raises:
+            requests.RequestException: If any request fails
+        """
+        workers = min(max_workers or self.max_workers, len(specs))
+        if workers <= 1:
+            return [self._make_request(**spec) for spec in specs]
+        
+        if self.client is not None and not self._in_event_loop():
+            return self._run_async(self._make_requests_batch_async(specs, workers))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._make_request, **spec) for spec in specs]
+            return [future.result() for future in futures]
+    
+    async def _make_requests_batch_async(
+        self,
+        specs: Sequence[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Make several requests concurrently with _make_request_async.
+        
+        Args:
+            specs: Keyword arguments for _make_request_async, one dict per request
+            max_workers: Maximum requests in flight (defaults to self.max_workers)
+            
+        Returns:
+            Responses in the same order as specs
+            
+        Raises:
+            requests.RequestException: If any request fails
+        """
+        semaphore = asyncio.Semaphore(max_workers or self.max_workers)
+        
+        async def bounded(spec: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self._make_request_async(**spec)
+        
+        return await asyncio.gather(*(bounded(spec) for spec in specs))
+    
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Whether the current thread is already running an event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+    
+    def _handle_response(self, response: Any) -> None:
+        """
+        Handle HTTP response and raise appropriate errors.
+        
+        Args:
+            response: requests or httpx response object
+            
+        A rate-limit rejection does not sleep here: the wait is recorded
+        with ``_defer_requests`` so that every worker, on any thread or
+        event loop, holds its next request until the limit resets.
+        
+        Raises:
+            requests.HTTPError: For HTTP error status codes
+        """
+        retry_after = self._rate_limited_wait(response)
+        if retry_after is not None:
+            self.logger.warning("Rate limit exceeded. Pausing requests for %.0f seconds", retry_after)
+            self._defer_requests(retry_after)
+            raise requests.HTTPError(
+                f"Rate limit exceeded: {response.status_code}", response=response
+            )
+        
+        self._raise_for_status(response)
+    
+    @staticmethod
+    def _raise_for_status(response: Any) -> None:
+        """
+        Raise requests.HTTPError for 4xx/5xx responses from either transport.
+        
+        Args:
+            response: requests or httpx response object
             
         Raises:
             requests.HTTPError: For HTTP error status codes
         """
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 60))
-            self.logger.warning(f"Rate limit exceeded. Waiting {retry_after} seconds")
-            time.sleep(retry_after)
-            raise requests.HTTPError(f"Rate limit exceeded: {response.status_code}")
+        if httpx is not None and isinstance(response, httpx.Response):
+            # httpx raises its own error type (and also on 3xx, including 304)
+            if response.is_error:
+                raise requests.HTTPError(
+                    f"{response.status_code} Error for url: {response.url}",
+                    response=response
+                )
+            return
         
         response.raise_for_status()
     
+    def _rate_limited_wait(self, response: Any) -> Optional[float]:
+        """
+        Get how long to wait if the response is a rate-limit rejection.
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            Seconds to wait, or None if the request was not rate limited
+        """
+        if response.status_code == 429 or self._is_rate_limited(response):
+            return self._retry_after(response.headers)
+        return None
+    
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """
+        Check whether a 403 response is a rate-limit rejection.
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            True if the request was refused because the quota ran out
+        """
+        if response.status_code != 403:
+            return False
+        headers = response.headers
+        return 'Retry-After' in headers or headers.get('X-RateLimit-Remaining') == '0'
+    
+    @staticmethod
+    def _retry_after(headers: Any) -> float:
+        """
+        Get the number of seconds to wait after a rate-limit rejection.
+        
+        Uses ``Retry-After`` when present, else the ``X-RateLimit-Reset``
+        epoch, else 60 seconds.
+        
+        Args:
+            headers: Response headers
+            
+        Returns:
+            Seconds to wait
+        """
+        try:
+            if 'Retry-After' in headers:
+                return max(float(headers['Retry-After']), 0.0)
+            if 'X-RateLimit-Reset' in headers:
+                return max(float(headers['X-RateLimit-Reset']) - time.time(), 0.0)
+        except ValueError:
+            pass
+        return 60.0
+    
+    def _update_pacing(self, headers: Any) -> None:
+        """
+        Derive the delay between requests from the reported rate-limit budget.
+        
+        While the budget is healthy only the token buckets apply. Once fewer than
+        ``LOW_BUDGET_FRACTION`` of the requests remain, they are spread
+        evenly over the time left until the reset. Responses without
+        ``X-RateLimit-*`` headers leave the pacing unchanged.
+        
+        Args:
+            headers: Response headers
+        """
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset_at = float(headers['X-RateLimit-Reset'])
+            limit = int(headers.get('X-RateLimit-Limit', 0))
+        except (KeyError, TypeError, ValueError):
+            return
+        
+        window = max(reset_at - time.time(), 0.0)
+        if remaining > limit * LOW_BUDGET_FRACTION:
+            delay = 0.0
+        else:
+            delay = window / max(remaining, 1)
+        
+        with self._rate_lock:
+            self._budget_delay = delay
+        
+        if remaining == 0:
+            # Nothing left: hold every request until the window resets
+            self._defer_requests(window)
+    
+    def _defer_requests(self, seconds: float) -> None:
+        """
+        Hold every request, from any thread, for at least ``seconds``.
+        
+        Args:
+            seconds: Time to wait before the next request
+        """
+        with self._rate_lock:
+            self._next_request_at = max(self._next_request_at, time.monotonic() + seconds)
+    
+    @staticmethod
+    def _credential_scope(credentials: Sequence[str]) -> str:
+        """
+        Derive the cache scope for a set of credentials.
+        
+        Args:
+            credentials: API keys the collector sends requests with
+            
+        Returns:
+            Short hash of the credentials, or '' when unauthenticated
+        """
+        if not credentials:
+            return ''
+        joined = '\n'.join(sorted(credentials))
+        return hashlib.sha256(joined.encode('utf-8')).hexdigest()[:12]
+    
+    @staticmethod
+    def _build_cached_response(url: str, entry: Dict[str, Any]) -> requests.Response:
+        """
+        Build a Response object from a TTL cache entry.
+        
+        Args:
+            url: Request URL
+            entry: Cached data written by _make_request
+            
+        Returns:
+            Response object replaying the cached body and Link header
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = 'utf-8'
+        response._content = entry['body'].encode('utf-8')
+        if entry.get('link'):
+            response.headers['Link'] = entry['link']
+        return response
+    
+    @staticmethod
+    def _is_no_store(response: Any) -> bool:
+        """
+        Check whether a response forbids caching.
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            True if the response carries ``Cache-Control: no-store``
+        """
+        return 'no-store' in response.headers.get('Cache-Control', '').lower()
+    
+    def _apply_etag_cache(
+        self,
+        response: requests.Response,
+        cache_key: str,
+        cached: Optional[CachedResponse]
+    ) -> None:
+        """
+        Replay the stored body on 304 and store fresh ETags on 200.
+        
+        A 304 does not count against GitHub's quota, so its token is
+        returned to the buckets. Responses marked ``Cache-Control: no-store``
+        are never stored.
+        
+        Args:
+            response: Response object
+            cache_key: ETag store key for the request
+            cached: Stored response for the key, if any
+        """
+        if response.status_code == 304 and cached:
+            self.logger.debug("Not modified, using stored body for %s", cache_key)
+            response._content = cached.body
+            if cached.link and 'Link' not in response.headers:
+                response.headers['Link'] = cached.link
+            for bucket in self.rate_limits:
+                bucket.refund()
+        elif (
+            self.etag_store is not None
+            and response.status_code == 200
+            and response.headers.get('ETag')
+            and not self._is_no_store(response)
+        ):
+            self.etag_store.set(
+                cache_key,
+                response.headers['ETag'],
+                response.content,
+                response.headers.get('Link')
+            )
+    
     def _rate_limit(self) -> None:
         """
-        Apply rate limiting delay between requests.
+        Wait until the request is allowed by every token bucket and by the
+        pacing derived from the server's rate-limit headers.
         """
-        if self.rate_limit_delay > 0:
-            time.sleep(self.rate_limit_delay)
+        wait = self._reserve_rate_limit()
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _reserve_rate_limit(self) -> float:
+        """
+        Reserve a request slot without waiting.
+        
+        Thread-safe: tokens and pacing slots are reserved under locks, so
+        requests issued from a thread pool may burst up to the bucket
+        capacity and then queue in order.
+        
+        Returns:
+            Seconds to wait before sending the request
+        """
+        wait = max((bucket.acquire() for bucket in self.rate_limits), default=0.0)
+        
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = max(wait, self._next_request_at - now)
+            if self._budget_delay > 0:
+                self._next_request_at = max(now, self._next_request_at) + self._budget_delay
+        
+        return wait
     
     def _handle_errors(self, error: Exception) -> None:
         """
@@ -159,10 +970,11 @@ class BaseCollector(ABC):
         Args:
             error: Exception to handle
         """
-        self.logger.error(f"Error occurred: {error}", exc_info=True)
+        self._error_count += 1
+        self.logger.error("Error occurred: %s", error, exc_info=True)
     
     @abstractmethod
-    def collect(self, **kwargs) -> Any:
+    def collect(self, **kwargs: Any) -> Any:
         """
         Collect data from the source. Must be implemented by subclasses.
         
@@ -174,10 +986,19 @@ class BaseCollector(ABC):
         """
         pass
     
-    def __enter__(self):
+    def __enter__(self: T) -> T:
         """Context manager entry."""
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
         """Context manager exit."""
         self.session.close()
+        if self.client is not None:
+            self.client.close()
+        if self.etag_store is not None:
+            self.etag_store.close()
@@ -33,13 +33,13 @@ class BaseExporter(ABC):
         """
         try:
             self.output_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.debug(f"Output directory ensured: {self.output_dir}")
+            self.logger.debug("Output directory ensured: %s", self.output_dir)
         except OSError as e:
-            self.logger.error(f"Failed to create output directory: {e}")
+            self.logger.error("Failed to create output directory: %s", e)
             raise
     
     @abstractmethod
-    def export(self, data: Any, filename: str, **kwargs) -> str:
+    def export(self, data: Any, filename: str, **kwargs: Any) -> str:
         """
         Export data to file. Must be implemented by subclasses.
         
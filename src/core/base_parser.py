@@ -4,7 +4,7 @@ Base parser class for data parsing
 
 from abc import ABC, abstractmethod
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 
 class BaseParser(ABC):
@@ -14,12 +14,12 @@ class BaseParser(ABC):
     Provides common functionality for parsing and validating data.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the base parser."""
         self.logger = logging.getLogger(self.__class__.__name__)
     
     @abstractmethod
-    def parse(self, data: Any, **kwargs) -> Any:
+    def parse(self, data: Any, **kwargs: Any) -> Any:
         """
         Parse raw data into structured format. Must be implemented by subclasses.
         
@@ -48,10 +48,10 @@ class BaseParser(ABC):
             return False
         
         if required_fields:
-            if isinstance(data, dict):
+            if isinstance(data, Mapping):
                 missing_fields = [field for field in required_fields if field not in data]
                 if missing_fields:
-                    self.logger.warning(f"Missing required fields: {missing_fields}")
+                    self.logger.warning("Missing required fields: %s", missing_fields)
                     return False
             elif isinstance(data, list):
                 if len(data) == 0:
@@ -59,13 +59,13 @@ class BaseParser(ABC):
                     # Empty list is valid structure (just no results)
                     return True
                 # Validate first item if list
-                if isinstance(data[0], dict):
+                if isinstance(data[0], Mapping):
                     missing_fields = [
                         field for field in required_fields
                         if field not in data[0]
                     ]
                     if missing_fields:
-                        self.logger.warning(f"Missing required fields in list items: {missing_fields}")
+                        self.logger.warning("Missing required fields in list items: %s", missing_fields)
                         return False
         
         return True
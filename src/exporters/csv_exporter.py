@@ -3,11 +3,70 @@ CSV data exporter
 """
 
 import csv
+import functools
+import json
 import logging
+from collections.abc import Iterable
+from dataclasses import fields, is_dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from ..core.base_exporter import BaseExporter
 
+# Bound once: used per cell and per nested list in the hot paths below
+_json_dumps = json.dumps
+
+
+def _format_value(value: Any) -> str:
+    """
+    Format value for CSV export.
+    
+    Called once per cell, so the common exact types are matched with
+    identity checks (no MRO walk) before the isinstance fallback.
+    
+    Args:
+        value: Value to format
+        
+    Returns:
+        Formatted string value
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value
+    elif value is None:
+        return ''
+    elif value_type is bool:
+        return 'true' if value else 'false'
+    elif value_type is list or value_type is dict or isinstance(value, (list, dict)):
+        return _json_dumps(value)
+    else:
+        return str(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(record_type: type) -> Tuple[str, ...]:
+    """Get the field names of a dataclass type, computed once per type."""
+    return tuple(field.name for field in fields(record_type))
+
+
+def _is_record(value: Any) -> bool:
+    """Check whether a value is a dataclass instance (e.g. a parser model)."""
+    return is_dataclass(value) and not isinstance(value, type)
+
+
+def _as_dict(item: Any) -> Any:
+    """
+    Convert a dataclass record to a dict of its fields.
+    
+    Args:
+        item: Dict, dataclass instance or other value
+        
+    Returns:
+        Dict for records, the item unchanged otherwise
+    """
+    if type(item) is dict or not _is_record(item):
+        return item
+    return {name: getattr(item, name) for name in _field_names(type(item))}
+
 
 class CSVExporter(BaseExporter):
     """
@@ -31,15 +90,22 @@ class CSVExporter(BaseExporter):
         data: Any,
         filename: str,
         flatten_nested: bool = True,
+        fieldnames: Optional[Sequence[str]] = None,
         **kwargs
     ) -> str:
         """
         Export data to CSV file.
         
+        Without ``fieldnames`` the columns are every key found in the data,
+        sorted, which needs a full pass over a materialized list. With a known
+        schema (e.g. ``GitHubParser.REPO_FIELDS``) that pass is skipped, and
+        ``data`` may be any iterable of dicts, which is written as it is consumed.
+        
         Args:
-            data: Data to export (list of dicts or single dict)
+            data: Data to export (list of dicts or dataclass records, or a single one)
             filename: Output filename (will add .csv if not present)
             flatten_nested: Flatten nested structures (e.g., lists to comma-separated strings)
+            fieldnames: Columns to write, in order; keys outside them are dropped
             **kwargs: Additional options
             
         Returns:
@@ -51,51 +117,73 @@ class CSVExporter(BaseExporter):
         
         file_path = self._get_file_path(filename)
         
-        # Convert single dict to list
-        if isinstance(data, dict):
+        # Convert single dict or record to list
+        if isinstance(data, dict) or _is_record(data):
             data = [data]
         
-        if not isinstance(data, list) or len(data) == 0:
+        # Without a schema every record is scanned first, so only lists are
+        # accepted; with one, any iterable of dicts is streamed
+        if isinstance(data, list):
+            has_data = len(data) > 0
+        else:
+            has_data = fieldnames is not None and isinstance(data, Iterable)
+        
+        if not has_data:
             self.logger.warning("No data to export or invalid format")
             return str(file_path)
         
-        # Flatten data if needed
-        if flatten_nested:
-            data = [self._flatten_dict(item) for item in data]
+        if fieldnames is None:
+            # Flatten data if needed; dataclass records are read field by field
+            if flatten_nested:
+                data = [self._flatten_dict(_as_dict(item)) for item in data]
+            else:
+                data = [_as_dict(item) for item in data]
+            
+            # Get all unique keys from all items
+            all_keys = set()
+            for item in data:
+                if isinstance(item, dict):
+                    all_keys.update(item.keys())
+            
+            fieldnames = sorted(all_keys)
+        elif flatten_nested:
+            data = (self._flatten_dict(item) for item in map(_as_dict, data) if isinstance(item, dict))
+        else:
+            data = map(_as_dict, data)
         
-        # Get all unique keys from all items
-        all_keys = set()
-        for item in data:
-            if isinstance(item, dict):
-                all_keys.update(item.keys())
+        count = 0
         
-        fieldnames = sorted(all_keys)
+        def rows():
+            nonlocal count
+            for item in data:
+                if isinstance(item, dict):
+                    count += 1
+                    yield tuple(map(_format_value, map(item.get, fieldnames)))
         
         try:
             with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(fieldnames)
                 
-                for item in data:
-                    if isinstance(item, dict):
-                        # Convert values to strings and handle None
-                        row = {
-                            key: self._format_value(item.get(key))
-                            for key in fieldnames
-                        }
-                        writer.writerow(row)
+                # Plain csv.writer rows skip DictWriter's per-row dict-to-list
+                # conversion; map() keeps the per-cell work out of bytecode
+                writer.writerows(rows())
             
-            self.logger.info(f"Exported {len(data)} rows to {file_path}")
+            self.logger.info("Exported %d rows to %s", count, file_path)
             return str(file_path)
             
         except Exception as e:
-            self.logger.error(f"Failed to export CSV: {e}")
+            self.logger.error("Failed to export CSV: %s", e)
             raise
     
     def _flatten_dict(self, data: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dict[str, Any]:
         """
         Flatten nested dictionary structure.
         
+        Walks the nesting with an explicit stack of item iterators and writes
+        into a single result dict, so no intermediate dicts are built per level
+        and key order matches a depth-first walk.
+        
         Args:
             data: Dictionary to flatten
             parent_key: Parent key prefix
@@ -104,43 +192,32 @@ class CSVExporter(BaseExporter):
         Returns:
             Flattened dictionary
         """
-        items = []
+        flat = {}
+        stack = [(parent_key, iter(data.items()))]
         
-        for key, value in data.items():
-            new_key = f"{parent_key}{sep}{key}" if parent_key else key
-            
-            if isinstance(value, dict):
-                items.extend(self._flatten_dict(value, new_key, sep=sep).items())
-            elif isinstance(value, list):
-                # Convert list to comma-separated string
-                if value and isinstance(value[0], dict):
-                    # List of dicts - convert to JSON string
-                    import json
-                    items.append((new_key, json.dumps(value)))
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                new_key = f"{prefix}{sep}{key}" if prefix else key
+                
+                if isinstance(value, dict):
+                    # Descend; this level resumes once the nested dict is done
+                    stack.append((new_key, iter(value.items())))
+                    break
+                elif isinstance(value, list):
+                    # Convert list to comma-separated string
+                    if value and isinstance(value[0], dict):
+                        # List of dicts - convert to JSON string
+                        flat[new_key] = _json_dumps(value)
+                    else:
+                        # Simple list - join with comma
+                        flat[new_key] = ', '.join(str(v) for v in value)
                 else:
-                    # Simple list - join with comma
-                    items.append((new_key, ', '.join(str(v) for v in value)))
+                    flat[new_key] = value
             else:
-                items.append((new_key, value))
+                stack.pop()
         
-        return dict(items)
+        return flat
     
-    def _format_value(self, value: Any) -> str:
-        """
-        Format value for CSV export.
-        
-        Args:
-            value: Value to format
-            
-        Returns:
-            Formatted string value
-        """
-        if value is None:
-            return ''
-        elif isinstance(value, bool):
-            return str(value).lower()
-        elif isinstance(value, (list, dict)):
-            import json
-            return json.dumps(value)
-        else:
-            return str(value)
+    # Stateless; exposed on the class so it can be called without an instance
+    _format_value = staticmethod(_format_value)
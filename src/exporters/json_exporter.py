@@ -4,10 +4,38 @@ JSON data exporter
 
 import json
 import logging
+from dataclasses import fields, is_dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 from ..core.base_exporter import BaseExporter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Lists longer than this are written item by item by export()
+STREAM_THRESHOLD = 10000
+
+# Streamed items are small; batch them into large writes
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serialize values the JSON encoders do not handle.
+    
+    Args:
+        value: Value to serialize
+        
+    Returns:
+        Dict of fields for dataclass records (e.g. parser models), else str(value)
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+    return str(value)
+
 
 class JSONExporter(BaseExporter):
     """
@@ -27,6 +55,17 @@ class JSONExporter(BaseExporter):
         super().__init__(output_dir)
         self.indent = indent
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # orjson only indents by two spaces; other layouts use the stdlib encoder.
+        # Datetimes go through the same default as with json; dataclasses are
+        # serialized natively, matching what _json_default produces.
+        self._orjson_option = None
+        if orjson is not None and indent == 2:
+            self._orjson_option = (
+                orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+            )
     
     def export(
         self,
@@ -38,6 +77,15 @@ class JSONExporter(BaseExporter):
         """
         Export data to JSON file.
         
+        Uses orjson when it is installed, which serializes straight to UTF-8
+        bytes several times faster than ``json.dump``. The output is
+        equivalent JSON, not byte-identical: floats may be spelled differently
+        (``1e16`` rather than ``1e+16``) and NaN/Infinity become ``null``.
+        Data orjson cannot encode, such as integers wider than 64 bits, is
+        written with ``json.dump`` instead.
+        Lists longer than ``STREAM_THRESHOLD`` are handed to ``export_stream``
+        so the whole document is never held in memory at once.
+        
         Args:
             data: Data to export (dict, list, or any JSON-serializable object)
             filename: Output filename (will add .json if not present)
@@ -47,6 +95,9 @@ class JSONExporter(BaseExporter):
         Returns:
             Path to exported file
         """
+        if isinstance(data, list) and len(data) > STREAM_THRESHOLD:
+            return self.export_stream(data, filename, ensure_ascii=ensure_ascii)
+        
         # Ensure .json extension
         if not filename.endswith('.json'):
             filename = f"{filename}.json"
@@ -54,22 +105,130 @@ class JSONExporter(BaseExporter):
         file_path = self._get_file_path(filename)
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(
-                    data,
-                    f,
-                    indent=self.indent,
-                    ensure_ascii=ensure_ascii,
-                    default=str  # Handle non-serializable objects
-                )
+            payload = self._orjson_dumps(data) if not ensure_ascii else None
+            if payload is not None:
+                with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    f.write(payload)
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(
+                        data,
+                        f,
+                        indent=self.indent,
+                        ensure_ascii=ensure_ascii,
+                        default=_json_default  # Handle non-serializable objects
+                    )
             
-            self.logger.info(f"Exported data to {file_path}")
+            self.logger.info("Exported data to %s", file_path)
             return str(file_path)
             
         except Exception as e:
-            self.logger.error(f"Failed to export JSON: {e}")
+            self.logger.error("Failed to export JSON: %s", e)
             raise
     
+    def _orjson_dumps(self, data: Any) -> Optional[bytes]:
+        """
+        Serialize data with orjson when it is enabled and able to.
+        
+        Args:
+            data: Data to serialize
+            
+        Returns:
+            Encoded JSON, or None to fall back to the stdlib encoder
+        """
+        if self._orjson_option is None:
+            return None
+        try:
+            return orjson.dumps(data, default=_json_default, option=self._orjson_option)
+        except (orjson.JSONEncodeError, TypeError) as e:
+            self.logger.debug("orjson cannot encode data (%s); using json", e)
+            return None
+    
+    def export_stream(
+        self,
+        items: Iterable[Any],
+        filename: str,
+        ensure_ascii: bool = False
+    ) -> str:
+        """
+        Export an iterable of items as a JSON array without materializing it.
+        
+        Items are serialized and written one at a time, so a generator can be
+        exported with constant memory. The output matches what ``export``
+        writes for the equivalent list, and uses orjson under the same
+        conditions; items orjson cannot encode are written with ``json``. If
+        an item fails to serialize, the partially written file is removed.
+        
+        Args:
+            items: Iterable of JSON-serializable items
+            filename: Output filename (will add .json if not present)
+            ensure_ascii: Ensure ASCII encoding
+            
+        Returns:
+            Path to exported file
+        """
+        if not filename.endswith('.json'):
+            filename = f"{filename}.json"
+        
+        file_path = self._get_file_path(filename)
+        newline = '\n' if self.indent is not None else ''
+        prefix = ' ' * self.indent if self.indent else ''
+        separator = ',' + (newline or ' ')
+        line_break = '\n'
+        count = 0
+        
+        binary = self._orjson_option is not None and not ensure_ascii
+        if binary:
+            encode = self._encode_item
+            newline, prefix, separator, line_break = (
+                token.encode() for token in (newline, prefix, separator, line_break)
+            )
+            opening, closing = b'[', b']'
+        else:
+            encode = partial(
+                json.dumps, indent=self.indent, ensure_ascii=ensure_ascii, default=_json_default
+            )
+            opening, closing = '[', ']'
+        
+        try:
+            mode = 'wb' if binary else 'w'
+            encoding = None if binary else 'utf-8'
+            with open(file_path, mode, buffering=WRITE_BUFFER_SIZE, encoding=encoding) as f:
+                write = f.write
+                write(opening)
+                for item in items:
+                    encoded = encode(item)
+                    if prefix:
+                        encoded = encoded.replace(line_break, line_break + prefix)
+                    write((separator if count else newline) + prefix + encoded)
+                    count += 1
+                write((newline if count else newline[:0]) + closing)
+            
+            self.logger.info("Exported %d items to %s", count, file_path)
+            return str(file_path)
+            
+        except Exception as e:
+            self.logger.error("Failed to export JSON: %s", e)
+            file_path.unlink(missing_ok=True)
+            raise
+    
+    def _encode_item(self, item: Any) -> bytes:
+        """
+        Encode one streamed item, falling back to json for what orjson rejects.
+        
+        Args:
+            item: Item to serialize
+            
+        Returns:
+            UTF-8 encoded JSON
+        """
+        encoded = self._orjson_dumps(item)
+        if encoded is None:
+            encoded = json.dumps(
+                item, indent=self.indent, ensure_ascii=False, default=_json_default
+            ).encode('utf-8')
+        return encoded
+    
     def export_multiple(
         self,
         data_dict: Dict[str, Any],
@@ -3,5 +3,6 @@ Data parsing modules
 """
 
 from .github_parser import GitHubParser
+from .models import Issue, Profile, PullRequest, Repo
 
-__all__ = ['GitHubParser']
+__all__ = ['GitHubParser', 'Repo', 'Issue', 'PullRequest', 'Profile']
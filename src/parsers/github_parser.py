@@ -2,10 +2,33 @@
 GitHub API data parser
 """
 
+import functools
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 from ..core.base_parser import BaseParser
+from .models import MODELS
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_date(date_str: str) -> Optional[str]:
+    """
+    Normalize an ISO 8601 date string.
+    
+    Cached because timestamps repeat heavily across paginated responses
+    and every record carries several of them.
+    
+    Args:
+        date_str: ISO format date string
+        
+    Returns:
+        Normalized date string, or None if it cannot be parsed
+    """
+    try:
+        # GitHub uses ISO 8601 format
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00')).isoformat()
+    except ValueError:
+        return None
 
 
 class GitHubParser(BaseParser):
@@ -15,18 +38,56 @@ class GitHubParser(BaseParser):
     Normalizes and structures GitHub API responses.
     """
     
-    def __init__(self):
+    # Keys of the parsed records, in output order. Exporters can use these
+    # as a fixed schema instead of scanning every record for its keys.
+    # ClassVar keeps them readable on the class when compiled with mypyc.
+    REPO_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'id', 'name', 'full_name', 'description', 'url', 'clone_url', 'language',
+        'stars', 'forks', 'watchers', 'open_issues', 'is_private', 'is_fork',
+        'created_at', 'updated_at', 'pushed_at', 'default_branch', 'topics'
+    )
+    ISSUE_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'id', 'number', 'title', 'body', 'state', 'url', 'user', 'labels',
+        'assignees', 'comments', 'created_at', 'updated_at', 'closed_at'
+    )
+    PR_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'id', 'number', 'title', 'body', 'state', 'url', 'user', 'head_branch',
+        'base_branch', 'labels', 'assignees', 'reviewers', 'comments',
+        'review_comments', 'commits', 'additions', 'deletions', 'changed_files',
+        'merged', 'mergeable', 'created_at', 'updated_at', 'closed_at', 'merged_at'
+    )
+    PROFILE_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'id', 'login', 'name', 'bio', 'company', 'blog', 'location', 'email',
+        'hireable', 'public_repos', 'public_gists', 'followers', 'following',
+        'created_at', 'updated_at', 'url'
+    )
+    FIELDS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        'repos': REPO_FIELDS,
+        'issues': ISSUE_FIELDS,
+        'prs': PR_FIELDS,
+        'profile': PROFILE_FIELDS
+    }
+    
+    def __init__(self) -> None:
         """Initialize GitHub parser."""
         super().__init__()
         self.logger = logging.getLogger(self.__class__.__name__)
     
-    def parse(self, data: Any, data_type: str = 'auto', **kwargs) -> Any:
+    def parse(
+        self,
+        data: Any,
+        data_type: str = 'auto',
+        as_models: bool = False,
+        **kwargs: Any
+    ) -> Any:
         """
         Parse GitHub API data.
         
         Args:
             data: Raw data from GitHub API
             data_type: Type of data (repos, issues, prs, profile, auto)
+            as_models: Return slotted records (see ``models``) instead of dicts,
+                which take roughly a third of the memory for large collections
             **kwargs: Additional parsing options
             
         Returns:
@@ -35,7 +96,7 @@ class GitHubParser(BaseParser):
         if data_type == 'auto':
             data_type = self._detect_data_type(data)
         
-        parsers = {
+        parsers: Dict[str, Callable[..., Any]] = {
             'repos': self._parse_repos,
             'issues': self._parse_issues,
             'prs': self._parse_pull_requests,
@@ -44,10 +105,67 @@ class GitHubParser(BaseParser):
         
         parser = parsers.get(data_type)
         if not parser:
-            self.logger.warning(f"Unknown data type: {data_type}, returning raw data")
+            self.logger.warning("Unknown data type: %s, returning raw data", data_type)
             return data
         
-        return parser(data, **kwargs)
+        parsed = parser(data, **kwargs)
+        return self._to_models(parsed, data_type) if as_models else parsed
+    
+    def parse_stream(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        data_type: str,
+        as_models: bool = False,
+        **kwargs: Any
+    ) -> Iterator[Any]:
+        """
+        Lazily parse a stream of GitHub list items.
+        
+        Args:
+            items: Iterable of raw items, e.g. from GitHubCollector.iter_user_repos
+            data_type: Type of data (repos, issues, prs)
+            as_models: Yield slotted records instead of dicts
+            **kwargs: Additional parsing options
+            
+        Yields:
+            Parsed items
+            
+        Raises:
+            ValueError: If data_type is not a list type
+        """
+        parsers: Dict[str, Callable[..., List[Dict[str, Any]]]] = {
+            'repos': self._parse_repos,
+            'issues': self._parse_issues,
+            'prs': self._parse_pull_requests
+        }
+        
+        parser = parsers.get(data_type)
+        if not parser:
+            raise ValueError(f"Cannot stream data type: {data_type}")
+        
+        for item in items:
+            parsed = parser([item], **kwargs)
+            yield from self._to_models(parsed, data_type) if as_models else parsed
+    
+    @staticmethod
+    def _to_models(parsed: Any, data_type: str) -> Any:
+        """
+        Convert parsed dicts to the slotted record type for ``data_type``.
+        
+        Args:
+            parsed: Parsed record or list of records
+            data_type: Type of data (repos, issues, prs, profile)
+            
+        Returns:
+            Record or list of records; an empty result is returned unchanged
+        """
+        if not parsed:
+            return parsed
+        
+        model = MODELS[data_type]
+        if isinstance(parsed, dict):
+            return model(**parsed)
+        return [model(**record) for record in parsed]
     
     def _detect_data_type(self, data: Any) -> str:
         """
@@ -64,14 +182,14 @@ class GitHubParser(BaseParser):
         
         if isinstance(data, list) and len(data) > 0:
             sample = data[0]
-            if isinstance(sample, dict):
+            if isinstance(sample, Mapping):
                 if 'pull_request' in sample:
                     return 'issues'
                 elif 'merged_at' in sample or 'mergeable' in sample:
                     return 'prs'
                 elif 'full_name' in sample or 'clone_url' in sample:
                     return 'repos'
-        elif isinstance(data, dict):
+        elif isinstance(data, Mapping):
             if 'login' in data and 'public_repos' in data:
                 return 'profile'
             elif 'full_name' in data or 'clone_url' in data:
@@ -79,7 +197,7 @@ class GitHubParser(BaseParser):
         
         return 'unknown'
     
-    def _parse_repos(self, repos: List[Dict[str, Any]], **kwargs) -> List[Dict[str, Any]]:
+    def _parse_repos(self, repos: List[Mapping[str, Any]], **kwargs: Any) -> List[Dict[str, Any]]:
         """
         Parse repository data.
         
@@ -92,33 +210,38 @@ class GitHubParser(BaseParser):
         if not isinstance(repos, list):
             repos = [repos] if repos else []
         
-        parsed = []
+        parsed: List[Dict[str, Any]] = []
+        parse_date = self._parse_date
+        append = parsed.append
         for repo in repos:
+            # Bound once per record: a literal of get() calls beats itemgetter
+            # or map() here, which would copy or re-walk the ~80-key payload
+            get = repo.get
             parsed_repo = {
-                'id': repo.get('id'),
-                'name': repo.get('name'),
-                'full_name': repo.get('full_name'),
-                'description': repo.get('description', ''),
-                'url': repo.get('html_url'),
-                'clone_url': repo.get('clone_url'),
-                'language': repo.get('language'),
-                'stars': repo.get('stargazers_count', 0),
-                'forks': repo.get('forks_count', 0),
-                'watchers': repo.get('watchers_count', 0),
-                'open_issues': repo.get('open_issues_count', 0),
-                'is_private': repo.get('private', False),
-                'is_fork': repo.get('fork', False),
-                'created_at': self._parse_date(repo.get('created_at')),
-                'updated_at': self._parse_date(repo.get('updated_at')),
-                'pushed_at': self._parse_date(repo.get('pushed_at')),
-                'default_branch': repo.get('default_branch', 'main'),
-                'topics': repo.get('topics', [])
+                'id': get('id'),
+                'name': get('name'),
+                'full_name': get('full_name'),
+                'description': get('description', ''),
+                'url': get('html_url'),
+                'clone_url': get('clone_url'),
+                'language': get('language'),
+                'stars': get('stargazers_count', 0),
+                'forks': get('forks_count', 0),
+                'watchers': get('watchers_count', 0),
+                'open_issues': get('open_issues_count', 0),
+                'is_private': get('private', False),
+                'is_fork': get('fork', False),
+                'created_at': parse_date(get('created_at')),
+                'updated_at': parse_date(get('updated_at')),
+                'pushed_at': parse_date(get('pushed_at')),
+                'default_branch': get('default_branch', 'main'),
+                'topics': get('topics', [])
             }
-            parsed.append(parsed_repo)
+            append(parsed_repo)
         
         return parsed
     
-    def _parse_issues(self, issues: List[Dict[str, Any]], **kwargs) -> List[Dict[str, Any]]:
+    def _parse_issues(self, issues: List[Mapping[str, Any]], **kwargs: Any) -> List[Dict[str, Any]]:
         """
         Parse issue data.
         
@@ -131,32 +254,35 @@ class GitHubParser(BaseParser):
         if not isinstance(issues, list):
             issues = [issues] if issues else []
         
-        parsed = []
+        parsed: List[Dict[str, Any]] = []
+        parse_date = self._parse_date
+        append = parsed.append
         for issue in issues:
+            get = issue.get
             # Skip pull requests (they appear in issues endpoint)
-            if issue.get('pull_request'):
+            if get('pull_request'):
                 continue
             
             parsed_issue = {
-                'id': issue.get('id'),
-                'number': issue.get('number'),
-                'title': issue.get('title'),
-                'body': issue.get('body', ''),
-                'state': issue.get('state'),
-                'url': issue.get('html_url'),
-                'user': issue.get('user', {}).get('login') if issue.get('user') else None,
-                'labels': [label.get('name') for label in issue.get('labels', [])],
-                'assignees': [assignee.get('login') for assignee in issue.get('assignees', [])],
-                'comments': issue.get('comments', 0),
-                'created_at': self._parse_date(issue.get('created_at')),
-                'updated_at': self._parse_date(issue.get('updated_at')),
-                'closed_at': self._parse_date(issue.get('closed_at'))
+                'id': get('id'),
+                'number': get('number'),
+                'title': get('title'),
+                'body': get('body', ''),
+                'state': get('state'),
+                'url': get('html_url'),
+                'user': (get('user') or {}).get('login'),
+                'labels': [label.get('name') for label in get('labels', [])],
+                'assignees': [assignee.get('login') for assignee in get('assignees', [])],
+                'comments': get('comments', 0),
+                'created_at': parse_date(get('created_at')),
+                'updated_at': parse_date(get('updated_at')),
+                'closed_at': parse_date(get('closed_at'))
             }
-            parsed.append(parsed_issue)
+            append(parsed_issue)
         
         return parsed
     
-    def _parse_pull_requests(self, prs: List[Dict[str, Any]], **kwargs) -> List[Dict[str, Any]]:
+    def _parse_pull_requests(self, prs: List[Mapping[str, Any]], **kwargs: Any) -> List[Dict[str, Any]]:
         """
         Parse pull request data.
         
@@ -169,39 +295,42 @@ class GitHubParser(BaseParser):
         if not isinstance(prs, list):
             prs = [prs] if prs else []
         
-        parsed = []
+        parsed: List[Dict[str, Any]] = []
+        parse_date = self._parse_date
+        append = parsed.append
         for pr in prs:
+            get = pr.get
             parsed_pr = {
-                'id': pr.get('id'),
-                'number': pr.get('number'),
-                'title': pr.get('title'),
-                'body': pr.get('body', ''),
-                'state': pr.get('state'),
-                'url': pr.get('html_url'),
-                'user': pr.get('user', {}).get('login') if pr.get('user') else None,
-                'head_branch': pr.get('head', {}).get('ref') if pr.get('head') else None,
-                'base_branch': pr.get('base', {}).get('ref') if pr.get('base') else None,
-                'labels': [label.get('name') for label in pr.get('labels', [])],
-                'assignees': [assignee.get('login') for assignee in pr.get('assignees', [])],
-                'reviewers': [reviewer.get('login') for reviewer in pr.get('requested_reviewers', [])],
-                'comments': pr.get('comments', 0),
-                'review_comments': pr.get('review_comments', 0),
-                'commits': pr.get('commits', 0),
-                'additions': pr.get('additions'),
-                'deletions': pr.get('deletions'),
-                'changed_files': pr.get('changed_files'),
-                'merged': pr.get('merged', False),
-                'mergeable': pr.get('mergeable'),
-                'created_at': self._parse_date(pr.get('created_at')),
-                'updated_at': self._parse_date(pr.get('updated_at')),
-                'closed_at': self._parse_date(pr.get('closed_at')),
-                'merged_at': self._parse_date(pr.get('merged_at'))
+                'id': get('id'),
+                'number': get('number'),
+                'title': get('title'),
+                'body': get('body', ''),
+                'state': get('state'),
+                'url': get('html_url'),
+                'user': (get('user') or {}).get('login'),
+                'head_branch': (get('head') or {}).get('ref'),
+                'base_branch': (get('base') or {}).get('ref'),
+                'labels': [label.get('name') for label in get('labels', [])],
+                'assignees': [assignee.get('login') for assignee in get('assignees', [])],
+                'reviewers': [reviewer.get('login') for reviewer in get('requested_reviewers', [])],
+                'comments': get('comments', 0),
+                'review_comments': get('review_comments', 0),
+                'commits': get('commits', 0),
+                'additions': get('additions'),
+                'deletions': get('deletions'),
+                'changed_files': get('changed_files'),
+                'merged': get('merged', False),
+                'mergeable': get('mergeable'),
+                'created_at': parse_date(get('created_at')),
+                'updated_at': parse_date(get('updated_at')),
+                'closed_at': parse_date(get('closed_at')),
+                'merged_at': parse_date(get('merged_at'))
             }
-            parsed.append(parsed_pr)
+            append(parsed_pr)
         
         return parsed
     
-    def _parse_profile(self, profile: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+    def _parse_profile(self, profile: Mapping[str, Any], **kwargs: Any) -> Dict[str, Any]:
         """
         Parse user profile data.
         
@@ -211,7 +340,7 @@ class GitHubParser(BaseParser):
         Returns:
             Parsed profile data
         """
-        if not isinstance(profile, dict):
+        if not isinstance(profile, Mapping):
             return {}
         
         parsed = {
@@ -247,14 +376,26 @@ class GitHubParser(BaseParser):
         """
         if not date_str:
             return None
+        if not isinstance(date_str, str):
+            self.logger.warning("Failed to parse date: %s", date_str)
+            return date_str
+        
+        # Fast path for GitHub's 'YYYY-MM-DDTHH:MM:SSZ', whose normalized form
+        # is the same string with a '+00:00' offset
+        if (
+            len(date_str) == 20
+            and date_str[19] == 'Z'
+            and date_str[10] == 'T'
+            and date_str[4] == date_str[7] == '-'
+            and date_str[13] == date_str[16] == ':'
+        ):
+            return date_str[:19] + '+00:00'
         
-        try:
-            # GitHub uses ISO 8601 format
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.isoformat()
-        except (ValueError, AttributeError):
-            self.logger.warning(f"Failed to parse date: {date_str}")
+        normalized = _normalize_date(date_str)
+        if normalized is None:
+            self.logger.warning("Failed to parse date: %s", date_str)
             return date_str
+        return normalized
     
     def validate(self, data: Any, required_fields: Optional[List[str]] = None) -> bool:
         """
@@ -274,7 +415,7 @@ class GitHubParser(BaseParser):
         if isinstance(data, list) and len(data) > 0:
             # Validate first item has expected structure
             first_item = data[0]
-            if not isinstance(first_item, dict):
+            if not isinstance(first_item, Mapping):
                 self.logger.warning("List items should be dictionaries")
                 return False
         
@@ -0,0 +1,131 @@
+"""
+Slotted record types for parsed GitHub data
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Type
+
+
+@dataclass(frozen=True)
+class Repo:
+    """Parsed repository, field for field the same as the dict form."""
+    # Declared by hand rather than with slots=True to keep Python 3.8 support
+    __slots__ = (
+        'id', 'name', 'full_name', 'description', 'url', 'clone_url', 'language',
+        'stars', 'forks', 'watchers', 'open_issues', 'is_private', 'is_fork',
+        'created_at', 'updated_at', 'pushed_at', 'default_branch', 'topics'
+    )
+    
+    id: Optional[int]
+    name: Optional[str]
+    full_name: Optional[str]
+    description: Optional[str]
+    url: Optional[str]
+    clone_url: Optional[str]
+    language: Optional[str]
+    stars: int
+    forks: int
+    watchers: int
+    open_issues: int
+    is_private: bool
+    is_fork: bool
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    pushed_at: Optional[str]
+    default_branch: str
+    topics: List[str]
+
+
+@dataclass(frozen=True)
+class Issue:
+    """Parsed issue, field for field the same as the dict form."""
+    __slots__ = (
+        'id', 'number', 'title', 'body', 'state', 'url', 'user', 'labels',
+        'assignees', 'comments', 'created_at', 'updated_at', 'closed_at'
+    )
+    
+    id: Optional[int]
+    number: Optional[int]
+    title: Optional[str]
+    body: Optional[str]
+    state: Optional[str]
+    url: Optional[str]
+    user: Optional[str]
+    labels: List[str]
+    assignees: List[str]
+    comments: int
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    closed_at: Optional[str]
+
+
+@dataclass(frozen=True)
+class PullRequest:
+    """Parsed pull request, field for field the same as the dict form."""
+    __slots__ = (
+        'id', 'number', 'title', 'body', 'state', 'url', 'user', 'head_branch',
+        'base_branch', 'labels', 'assignees', 'reviewers', 'comments',
+        'review_comments', 'commits', 'additions', 'deletions', 'changed_files',
+        'merged', 'mergeable', 'created_at', 'updated_at', 'closed_at', 'merged_at'
+    )
+    
+    id: Optional[int]
+    number: Optional[int]
+    title: Optional[str]
+    body: Optional[str]
+    state: Optional[str]
+    url: Optional[str]
+    user: Optional[str]
+    head_branch: Optional[str]
+    base_branch: Optional[str]
+    labels: List[str]
+    assignees: List[str]
+    reviewers: List[str]
+    comments: int
+    review_comments: int
+    commits: int
+    additions: Optional[int]
+    deletions: Optional[int]
+    changed_files: Optional[int]
+    merged: bool
+    mergeable: Optional[bool]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    closed_at: Optional[str]
+    merged_at: Optional[str]
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Parsed user profile, field for field the same as the dict form."""
+    __slots__ = (
+        'id', 'login', 'name', 'bio', 'company', 'blog', 'location', 'email',
+        'hireable', 'public_repos', 'public_gists', 'followers', 'following',
+        'created_at', 'updated_at', 'url'
+    )
+    
+    id: Optional[int]
+    login: Optional[str]
+    name: Optional[str]
+    bio: Optional[str]
+    company: Optional[str]
+    blog: Optional[str]
+    location: Optional[str]
+    email: Optional[str]
+    hireable: Optional[bool]
+    public_repos: int
+    public_gists: int
+    followers: int
+    following: int
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    url: Optional[str]
+
+
+# Parser data type -> record type
+MODELS: Dict[str, Type[Any]] = {
+    'repos': Repo,
+    'issues': Issue,
+    'prs': PullRequest,
+    'profile': Profile
+}
@@ -3,5 +3,7 @@ Utility modules
 """
 
 from .logger import setup_logger
+from .etag_store import ETagStore
+from .rate_limiter import TokenBucket
 
-__all__ = ['setup_logger']
+__all__ = ['setup_logger', 'ETagStore', 'TokenBucket']
@@ -0,0 +1,188 @@
+"""
+File-based TTL cache for API responses
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+
+DEFAULT_CACHE_DIR = '~/.api-collector-cache'
+
+
+class ApiCache:
+    """
+    Disk cache for idempotent GET responses.
+    
+    Each entry is a gzipped JSON file named after the SHA-1 of the request
+    URL and query string, holding a ``{timestamp, ttl, data}`` wrapper.
+    Entries fetched with different credentials are kept apart by a scope.
+    """
+    
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, default_ttl: float = 15 * 60):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding cache entries
+            default_ttl: Time-to-live in seconds when none is given
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.default_ttl = default_ttl
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None, scope: str = '') -> str:
+        """
+        Build the cache key for a request.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            scope: Credential scope, so one token never reads another's entries
+            
+        Returns:
+            Hex SHA-1 digest of the scope, URL and sorted query string
+        """
+        query = urlencode(sorted(params.items())) if params else ''
+        request = f"{url}?{query}"
+        if scope:
+            request = f"{scope}\n{request}"
+        return hashlib.sha1(request.encode('utf-8')).hexdigest()
+    
+    def _entry_path(self, key: str) -> Path:
+        """
+        Get the file path for a cache key.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Path to the entry file
+        """
+        return self.cache_dir / f"{key}.json.gz"
+    
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        scope: str = ''
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read a fresh cache entry.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            scope: Credential scope the entry was stored under
+            
+        Returns:
+            Cached data, or None if missing, expired or unreadable
+        """
+        path = self._entry_path(self.make_key(url, params, scope))
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+            if time.time() - entry['timestamp'] > entry['ttl']:
+                return None
+            data: Dict[str, Any] = entry['data']
+            return data
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+    
+    def set(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Dict[str, Any],
+        ttl: Optional[float] = None,
+        scope: str = ''
+    ) -> None:
+        """
+        Write a cache entry.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            data: JSON-serializable data to cache
+            ttl: Time-to-live in seconds (defaults to default_ttl)
+            scope: Credential scope of the request
+        """
+        entry = {
+            'timestamp': time.time(),
+            'ttl': self.default_ttl if ttl is None else ttl,
+            'data': data
+        }
+        path = self._entry_path(self.make_key(url, params, scope))
+        tmp_path: Optional[str] = None
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so concurrent readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning("Failed to write cache entry %s: %s", path, e)
+        finally:
+            # Only left behind when the write or the rename failed
+            if tmp_path is not None and os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    def clear(self) -> int:
+        """
+        Delete all cache entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for path in self.cache_dir.glob('*.json.gz'):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                self.logger.warning("Failed to remove cache entry %s: %s", path, e)
+        return removed
+    
+    def status(self) -> Dict[str, Any]:
+        """
+        Summarize cache contents.
+        
+        Returns:
+            Dictionary with entry counts and total size
+        """
+        entries = expired = size = 0
+        now = time.time()
+        
+        for path in self.cache_dir.glob('*.json.gz'):
+            entries += 1
+            size += path.stat().st_size
+            try:
+                with gzip.open(path, 'rt', encoding='utf-8') as f:
+                    entry = json.load(f)
+                if now - entry['timestamp'] > entry['ttl']:
+                    expired += 1
+            except (OSError, ValueError, KeyError):
+                expired += 1
+        
+        return {
+            'path': str(self.cache_dir),
+            'entries': entries,
+            'expired': expired,
+            'size_bytes': size
+        }
@@ -0,0 +1,97 @@
+"""
+Persistent ETag store for conditional requests
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+from urllib.parse import urlencode
+
+
+class CachedResponse(NamedTuple):
+    """Stored validator and payload for a URL."""
+    etag: str
+    body: bytes
+    link: Optional[str]
+
+
+class ETagStore:
+    """
+    SQLite-backed store of ETags and response bodies.
+    
+    GitHub answers a request carrying a matching ``If-None-Match`` header
+    with ``304 Not Modified``, which does not count against the rate limit.
+    The stored body is replayed for those responses.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) the store.
+        
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS etags ('
+            'key TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL, link TEXT)'
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None, scope: str = '') -> str:
+        """
+        Build the lookup key for a request.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            scope: Credential scope, so one token never replays another's bodies
+            
+        Returns:
+            Key combining the scope, the URL and the sorted parameters
+        """
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        return f"{scope}:{key}" if scope else key
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a stored response.
+        
+        Args:
+            key: Request key
+            
+        Returns:
+            Stored response or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT etag, body, link FROM etags WHERE key = ?', (key,)
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+    
+    def set(self, key: str, etag: str, body: bytes, link: Optional[str] = None) -> None:
+        """
+        Store (or replace) a response.
+        
+        Args:
+            key: Request key
+            etag: ETag header value
+            body: Raw response body
+            link: Link header value, needed to keep paginating from a 304
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO etags (key, etag, body, link) VALUES (?, ?, ?, ?)',
+                (key, etag, body, link)
+            )
+            self._conn.commit()
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
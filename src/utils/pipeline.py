@@ -0,0 +1,118 @@
+"""
+Threaded producer/consumer pipeline helpers
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, NamedTuple, TypeVar
+
+
+T = TypeVar('T')
+U = TypeVar('U')
+
+_DONE = object()
+
+
+class _Failure(NamedTuple):
+    """Exception raised by a pipeline stage, forwarded to the consumer."""
+    error: Exception
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Group an iterable into lists of at most ``size`` items.
+    
+    Args:
+        iterable: Items to group
+        size: Maximum batch size
+        
+    Yields:
+        Lists of consecutive items
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def pipelined(
+    source: Iterable[T],
+    transform: Callable[[T], U],
+    maxsize: int = 4
+) -> Iterator[U]:
+    """
+    Run a fetch -> transform -> consume pipeline across threads.
+    
+    A fetcher thread drains ``source`` and a worker thread applies
+    ``transform``, while the caller consumes the results. That way,
+    waiting on the network, parsing and writing overlap. Bounded queues
+    apply backpressure, so a slow consumer holds at most ``maxsize``
+    pending items per stage. Exceptions from either stage are re-raised
+    in the consumer, and closing the iterator early stops both threads.
+    
+    Args:
+        source: Items to fetch (typically a lazy, network-backed iterator)
+        transform: Function applied to each item on the worker thread
+        maxsize: Capacity of each queue between stages
+        
+    Yields:
+        Transformed items in source order
+    """
+    fetched: queue.Queue = queue.Queue(maxsize)
+    transformed: queue.Queue = queue.Queue(maxsize)
+    stop = threading.Event()
+    
+    def put(target: queue.Queue, item) -> bool:
+        # Poll so a stopped consumer never leaves a stage blocked forever
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def fetch() -> None:
+        try:
+            for item in source:
+                if not put(fetched, item):
+                    return
+        except Exception as e:
+            put(fetched, _Failure(e))
+            return
+        put(fetched, _DONE)
+    
+    def work() -> None:
+        while not stop.is_set():
+            try:
+                item = fetched.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _DONE or isinstance(item, _Failure):
+                put(transformed, item)
+                return
+            try:
+                result = transform(item)
+            except Exception as e:
+                put(transformed, _Failure(e))
+                return
+            if not put(transformed, result):
+                return
+    
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix='pipeline') as executor:
+        executor.submit(fetch)
+        executor.submit(work)
+        try:
+            while True:
+                item = transformed.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
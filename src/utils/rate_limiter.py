@@ -0,0 +1,86 @@
+"""
+Token-bucket rate limiter
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    
+    Up to ``capacity`` requests may be sent back to back; after that the
+    bucket refills at ``refill_rate`` tokens per second. ``acquire`` reserves
+    tokens immediately and returns how long the caller must wait, so
+    concurrent callers queue up in order instead of racing for tokens.
+    Several buckets (e.g. per-minute and per-hour) can be combined by
+    acquiring from each and waiting for the longest delay.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+            
+        Raises:
+            ValueError: If capacity or refill_rate is not positive
+        """
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("TokenBucket capacity and refill_rate must be positive")
+        
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def per_interval(cls, requests: int, seconds: float) -> 'TokenBucket':
+        """
+        Build a bucket allowing ``requests`` per ``seconds``, all as one burst.
+        
+        Args:
+            requests: Requests allowed per interval
+            seconds: Interval length in seconds
+            
+        Returns:
+            TokenBucket instance
+        """
+        return cls(capacity=requests, refill_rate=requests / seconds)
+    
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill. Caller holds the lock."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    def acquire(self, cost: float = 1) -> float:
+        """
+        Reserve tokens for a request.
+        
+        Args:
+            cost: Number of tokens to take
+            
+        Returns:
+            Seconds to wait before sending the request (0 if tokens were available)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= cost
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.refill_rate
+    
+    def refund(self, cost: float = 1) -> None:
+        """
+        Return tokens for a request that did not use any quota.
+        
+        Args:
+            cost: Number of tokens to return
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens + cost)
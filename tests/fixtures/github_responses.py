@@ -1,9 +1,14 @@
 """
 Sample GitHub API responses for testing
+
+The payloads are read-only mapping proxies so a single instance can be
+shared by every test; build a dict from one to make a modified copy.
 """
 
+from types import MappingProxyType
+
 # Sample repository response
-SAMPLE_REPO = {
+SAMPLE_REPO = MappingProxyType({
     "id": 123456,
     "name": "test-repo",
     "full_name": "testuser/test-repo",
@@ -22,10 +27,10 @@ SAMPLE_REPO = {
     "pushed_at": "2023-12-01T00:00:00Z",
     "default_branch": "main",
     "topics": ["python", "testing"]
-}
+})
 
 # Sample issue response
-SAMPLE_ISSUE = {
+SAMPLE_ISSUE = MappingProxyType({
     "id": 789012,
     "number": 1,
     "title": "Test Issue",
@@ -39,10 +44,10 @@ SAMPLE_ISSUE = {
     "created_at": "2023-11-01T00:00:00Z",
     "updated_at": "2023-11-02T00:00:00Z",
     "closed_at": None
-}
+})
 
 # Sample pull request response
-SAMPLE_PR = {
+SAMPLE_PR = MappingProxyType({
     "id": 345678,
     "number": 5,
     "title": "Test PR",
@@ -67,10 +72,10 @@ SAMPLE_PR = {
     "updated_at": "2023-11-16T00:00:00Z",
     "closed_at": None,
     "merged_at": None
-}
+})
 
 # Sample user profile response
-SAMPLE_PROFILE = {
+SAMPLE_PROFILE = MappingProxyType({
     "id": 111222,
     "login": "testuser",
     "name": "Test User",
@@ -87,4 +92,4 @@ SAMPLE_PROFILE = {
     "created_at": "2020-01-01T00:00:00Z",
     "updated_at": "2023-12-01T00:00:00Z",
     "html_url": "https://github.com/testuser"
-}
+})
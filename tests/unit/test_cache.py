@@ -0,0 +1,91 @@
+"""
+Unit tests for ApiCache
+"""
+
+import time
+from unittest.mock import patch
+from src.collectors.github_collector import GitHubCollector
+from src.utils.cache import ApiCache
+
+
+class TestApiCache:
+    """Test cases for ApiCache."""
+    
+    def test_set_and_get(self, tmp_path):
+        """Test round-tripping an entry."""
+        cache = ApiCache(str(tmp_path))
+        cache.set("https://api.github.com/users/x", {"page": 1}, {"body": "{}"})
+        
+        assert cache.get("https://api.github.com/users/x", {"page": 1}) == {"body": "{}"}
+        assert cache.get("https://api.github.com/users/x", {"page": 2}) is None
+    
+    def test_expired_entry(self, tmp_path):
+        """Test that entries older than their TTL are ignored."""
+        cache = ApiCache(str(tmp_path))
+        cache.set("https://api.github.com/users/x", None, {"body": "{}"}, ttl=10)
+        
+        with patch('src.utils.cache.time.time', return_value=time.time() + 60):
+            assert cache.get("https://api.github.com/users/x") is None
+            assert cache.status()['expired'] == 1
+    
+    def test_clear_and_status(self, tmp_path):
+        """Test cache status and clearing."""
+        cache = ApiCache(str(tmp_path))
+        cache.set("https://api.github.com/a", None, {"body": "1"})
+        cache.set("https://api.github.com/b", None, {"body": "2"})
+        
+        assert cache.status()['entries'] == 2
+        assert cache.clear() == 2
+        assert cache.status()['entries'] == 0
+    
+    def test_scopes_are_isolated(self, tmp_path):
+        """Test that entries stored under one credential scope are not shared."""
+        cache = ApiCache(str(tmp_path))
+        cache.set("https://api.github.com/user/repos", None, {"body": "[]"}, scope="abc")
+        
+        assert cache.get("https://api.github.com/user/repos", scope="abc") == {"body": "[]"}
+        assert cache.get("https://api.github.com/user/repos", scope="def") is None
+        assert cache.get("https://api.github.com/user/repos") is None
+    
+    def test_failed_write_removes_temp_file(self, tmp_path):
+        """Test that a failed write leaves no temp file behind."""
+        cache = ApiCache(str(tmp_path))
+        
+        with patch('src.utils.cache.os.replace', side_effect=OSError("disk full")):
+            cache.set("https://api.github.com/users/x", None, {"body": "{}"})
+        
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_collector_cache_is_per_token(self, tmp_path):
+        """Test that a collector never reads entries cached under another token."""
+        owner = GitHubCollector(api_key="a", rate_limit_delay=0, cache_dir=str(tmp_path))
+        owner.cache.set(
+            "https://api.github.com/users/testuser",
+            None,
+            {"body": '{"login": "testuser"}', "link": None},
+            scope=owner._cache_scope
+        )
+        other = GitHubCollector(api_key="b", rate_limit_delay=0, cache_dir=str(tmp_path))
+        
+        assert other._lookup_cache("https://api.github.com/users/testuser", 'GET', None, False) is None
+        assert owner._lookup_cache("https://api.github.com/users/testuser", 'GET', None, False) is not None
+    
+    def test_collector_uses_cache(self, tmp_path):
+        """Test that cached responses skip the network unless refreshed."""
+        collector = GitHubCollector(rate_limit_delay=0, cache_dir=str(tmp_path))
+        collector.cache.set(
+            "https://api.github.com/users/testuser",
+            None,
+            {"body": '{"login": "testuser"}', "link": None}
+        )
+        
+        with patch.object(collector.session, 'request') as mock_request:
+            profile = collector.collect_user_profile("testuser")
+        
+        assert profile == {"login": "testuser"}
+        mock_request.assert_not_called()
+        
+        with patch.object(collector.session, 'request') as mock_request:
+            collector.collect_user_profile("testuser", refresh=True)
+        
+        mock_request.assert_called_once()
@@ -0,0 +1,87 @@
+"""
+Unit tests for ETagStore and conditional requests
+"""
+
+import pytest
+import requests
+from unittest.mock import patch
+from src.collectors.github_collector import GitHubCollector
+from src.utils.etag_store import ETagStore
+
+
+def _response(status_code, body=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class TestETagStore:
+    """Test cases for ETagStore."""
+    
+    def test_set_and_get(self, tmp_path):
+        """Test storing and reading back a response."""
+        store = ETagStore(str(tmp_path / "etags.sqlite"))
+        key = store.make_key("https://api.github.com/users/x/repos", {"page": 1, "per_page": 100})
+        
+        assert store.get(key) is None
+        store.set(key, '"abc"', b'[1]', '<next>; rel="next"')
+        
+        cached = store.get(key)
+        assert cached.etag == '"abc"'
+        assert cached.body == b'[1]'
+        assert cached.link == '<next>; rel="next"'
+        store.close()
+    
+    def test_make_key_sorts_params(self):
+        """Test that parameter order does not change the key."""
+        assert ETagStore.make_key("u", {"b": 1, "a": 2}) == ETagStore.make_key("u", {"a": 2, "b": 1})
+    
+    def test_not_modified_replays_body(self, tmp_path):
+        """Test that a 304 reply returns the stored body."""
+        collector = GitHubCollector(
+            rate_limit_delay=0,
+            etag_cache_path=str(tmp_path / "etags.sqlite")
+        )
+        responses = [
+            _response(200, b'{"login": "testuser"}', {'ETag': '"v1"'}),
+            _response(304)
+        ]
+        
+        with patch.object(collector.session, 'request', side_effect=responses) as mock_request:
+            first = collector.collect_user_profile("testuser")
+            second = collector.collect_user_profile("testuser")
+        
+        assert first == second == {"login": "testuser"}
+        assert mock_request.call_args_list[1].kwargs['headers']['If-None-Match'] == '"v1"'
+    
+    def test_not_modified_refunds_token(self, tmp_path):
+        """Test that a 304 reply does not use up a rate-limit token."""
+        collector = GitHubCollector(etag_cache_path=str(tmp_path / "etags.sqlite"))
+        bucket = collector.rate_limits[0]
+        responses = [
+            _response(200, b'{"login": "testuser"}', {'ETag': '"v1"'}),
+            _response(304)
+        ]
+        
+        with patch.object(collector.session, 'request', side_effect=responses):
+            collector.collect_user_profile("testuser")
+            tokens = bucket.tokens
+            collector.collect_user_profile("testuser")
+        
+        assert bucket.tokens == pytest.approx(tokens, abs=0.1)
+    
+    def test_no_store_is_not_cached(self, tmp_path):
+        """Test that Cache-Control: no-store responses are not stored."""
+        collector = GitHubCollector(
+            rate_limit_delay=0,
+            etag_cache_path=str(tmp_path / "etags.sqlite")
+        )
+        response = _response(200, b'{}', {'ETag': '"v1"', 'Cache-Control': 'private, no-store'})
+        
+        with patch.object(collector.session, 'request', return_value=response) as mock_request:
+            collector.collect_user_profile("testuser")
+            collector.collect_user_profile("testuser")
+        
+        assert 'If-None-Match' not in (mock_request.call_args_list[1].kwargs['headers'] or {})
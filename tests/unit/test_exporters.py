@@ -4,58 +4,54 @@ Unit tests for exporters
 
 import pytest
 import json
-import csv
+import os
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 from src.exporters.json_exporter import JSONExporter
 from src.exporters.csv_exporter import CSVExporter
+from src.parsers.github_parser import GitHubParser
 
 
 class TestJSONExporter:
     """Test cases for JSONExporter."""
     
-    def test_init(self, temp_output_dir):
+    def test_init(self, exporter_dir):
         """Test exporter initialization."""
-        exporter = JSONExporter(output_dir=temp_output_dir)
-        assert exporter.output_dir == Path(temp_output_dir)
+        exporter = JSONExporter(output_dir=exporter_dir)
+        assert exporter.output_dir == Path(exporter_dir)
         assert exporter.indent == 2
     
-    def test_export_single_dict(self, temp_output_dir):
-        """Test exporting a single dictionary."""
-        exporter = JSONExporter(output_dir=temp_output_dir)
-        data = {"name": "test", "value": 123}
+    def test_output_dir_recreated(self, exporter_dir):
+        """Test a deleted output directory is created again by the next exporter."""
+        output_dir = Path(exporter_dir) / "shared"
+        JSONExporter(output_dir=str(output_dir))
+        output_dir.rmdir()
         
-        file_path = exporter.export(data, "test.json")
+        exporter = CSVExporter(output_dir=str(output_dir))
         
-        assert Path(file_path).exists()
-        with open(file_path, 'r') as f:
-            loaded = json.load(f)
-            assert loaded == data
+        assert output_dir.is_dir()
+        assert Path(exporter.export([{"id": 1}], "test")).exists()
     
-    def test_export_list(self, temp_output_dir):
-        """Test exporting a list."""
-        exporter = JSONExporter(output_dir=temp_output_dir)
-        data = [{"id": 1}, {"id": 2}]
-        
-        file_path = exporter.export(data, "test_list.json")
-        
-        assert Path(file_path).exists()
+    @pytest.mark.parametrize("data, filename, expected_name", [
+        ({"name": "test", "value": 123}, "test.json", "test.json"),
+        ([{"id": 1}, {"id": 2}], "test_list.json", "test_list.json"),
+        ({"test": "data"}, "test", "test.json")
+    ], ids=["single_dict", "list", "auto_extension"])
+    def test_export(self, exporter_dir, data, filename, expected_name):
+        """Test exporting a dict or list, adding the .json extension when missing."""
+        exporter = JSONExporter(output_dir=exporter_dir)
+        
+        file_path = exporter.export(data, filename)
+        
+        assert Path(file_path).name == expected_name
         with open(file_path, 'r') as f:
-            loaded = json.load(f)
-            assert len(loaded) == 2
-    
-    def test_export_auto_extension(self, temp_output_dir):
-        """Test automatic .json extension addition."""
-        exporter = JSONExporter(output_dir=temp_output_dir)
-        data = {"test": "data"}
-        
-        file_path = exporter.export(data, "test")
-        
-        assert file_path.endswith('.json')
-        assert Path(file_path).exists()
+            assert json.load(f) == data
     
-    def test_export_multiple(self, temp_output_dir):
+    def test_export_multiple(self, exporter_dir):
         """Test exporting multiple datasets."""
-        exporter = JSONExporter(output_dir=temp_output_dir)
+        exporter = JSONExporter(output_dir=exporter_dir)
         data_dict = {
             "repos": [{"id": 1}],
             "issues": [{"id": 2}]
@@ -64,60 +60,115 @@ class TestJSONExporter:
         files = exporter.export_multiple(data_dict, prefix="test_")
         
         assert len(files) == 2
-        assert all(Path(f).exists() for f in files)
-
-
-class TestCSVExporter:
-    """Test cases for CSVExporter."""
+        assert all(os.path.isfile(f) for f in files)
     
-    def test_init(self, temp_output_dir):
-        """Test exporter initialization."""
-        exporter = CSVExporter(output_dir=temp_output_dir)
-        assert exporter.output_dir == Path(temp_output_dir)
+    def test_export_stream(self, exporter_dir):
+        """Test streaming a generator matches exporting the list."""
+        exporter = JSONExporter(output_dir=exporter_dir)
+        data = [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}]
+        
+        list_path = exporter.export(data, "test_list.json")
+        stream_path = exporter.export_stream((item for item in data), "test_stream")
+        
+        assert stream_path.endswith('.json')
+        assert Path(stream_path).read_text() == Path(list_path).read_text()
     
-    def test_export_list_of_dicts(self, temp_output_dir):
-        """Test exporting list of dictionaries."""
-        exporter = CSVExporter(output_dir=temp_output_dir)
-        data = [
-            {"name": "Item 1", "value": 10},
-            {"name": "Item 2", "value": 20}
-        ]
+    def test_export_stream_falls_back_to_json(self, exporter_dir):
+        """Test items orjson cannot encode are streamed with json."""
+        exporter = JSONExporter(output_dir=exporter_dir)
+        data = [{"id": 1}, {"id": 2 ** 70}]
         
-        file_path = exporter.export(data, "test.csv")
+        file_path = exporter.export_stream(iter(data), "test_bigint")
         
-        assert Path(file_path).exists()
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            assert len(rows) == 2
-            assert rows[0]['name'] == 'Item 1'
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        assert Path(file_path).read_text(encoding='utf-8') == expected
     
-    def test_export_single_dict(self, temp_output_dir):
-        """Test exporting single dictionary."""
-        exporter = CSVExporter(output_dir=temp_output_dir)
-        data = {"name": "Item", "value": 10}
+    def test_export_stream_removes_partial_file(self, exporter_dir):
+        """Test a failed stream leaves no truncated file behind."""
+        exporter = JSONExporter(output_dir=exporter_dir)
         
-        file_path = exporter.export(data, "test_single.csv")
+        def items():
+            yield {"id": 1}
+            raise ValueError("source failed")
         
-        assert Path(file_path).exists()
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            assert len(rows) == 1
+        with pytest.raises(ValueError):
+            exporter.export_stream(items(), "test_partial")
+        
+        assert not (Path(exporter_dir) / "test_partial.json").exists()
+    
+    def test_export_large_list_streams(self, exporter_dir, monkeypatch):
+        """Test lists above the threshold are streamed with unchanged output."""
+        monkeypatch.setattr('src.exporters.json_exporter.STREAM_THRESHOLD', 1)
+        exporter = JSONExporter(output_dir=exporter_dir)
+        data = [{"id": 1, "name": "café"}, {"id": 2, "tags": ["a"]}]
+        
+        with patch.object(exporter, 'export_stream', wraps=exporter.export_stream) as mock_stream:
+            file_path = exporter.export(data, "test_large")
+        
+        mock_stream.assert_called_once()
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        assert Path(file_path).read_text(encoding='utf-8') == expected
+    
+    def test_export_models(self, exporter_dir, sample_repo_data):
+        """Test slotted parser records export exactly like their dicts."""
+        parser = GitHubParser()
+        records = parser.parse([sample_repo_data], data_type='repos')
+        models = parser.parse([sample_repo_data], data_type='repos', as_models=True)
+        
+        for exporter in (JSONExporter(output_dir=exporter_dir),
+                         JSONExporter(output_dir=exporter_dir, indent=4),
+                         CSVExporter(output_dir=exporter_dir)):
+            dict_path = exporter.export(records, "test_dicts")
+            model_path = exporter.export(models, "test_models")
+            assert Path(model_path).read_text() == Path(dict_path).read_text()
     
-    def test_export_auto_extension(self, temp_output_dir):
-        """Test automatic .csv extension addition."""
-        exporter = CSVExporter(output_dir=temp_output_dir)
-        data = [{"test": "data"}]
+    def test_export_orjson_matches_stdlib(self, exporter_dir):
+        """Test the orjson fast path writes JSON equivalent to json.dump."""
+        exporter = JSONExporter(output_dir=exporter_dir)
+        data = [{"name": "café", "created": datetime(2024, 1, 1), 1: None, "tags": ["a"]}]
         
-        file_path = exporter.export(data, "test")
+        file_path = exporter.export(data, "test_orjson.json")
         
-        assert file_path.endswith('.csv')
-        assert Path(file_path).exists()
+        expected = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+        assert Path(file_path).read_text(encoding='utf-8') == expected
+        
+        # Floats may be spelled differently; integers past 64 bits need json
+        for name, numbers in [("floats", [{"big": 1e16, "small": 1e-7}]), ("bigint", [{"id": 2 ** 70}])]:
+            file_path = exporter.export(numbers, f"test_{name}.json")
+            with open(file_path, 'r', encoding='utf-8') as f:
+                assert json.load(f) == numbers
+
+
+class TestCSVExporter:
+    """Test cases for CSVExporter."""
+    
+    def test_init(self, exporter_dir):
+        """Test exporter initialization."""
+        exporter = CSVExporter(output_dir=exporter_dir)
+        assert exporter.output_dir == Path(exporter_dir)
     
-    def test_flatten_nested_dict(self, temp_output_dir):
+    @pytest.mark.parametrize("data, filename, expected_name, expected_lines", [
+        (
+            [{"name": "Item 1", "value": 10}, {"name": "Item 2", "value": 20}],
+            "test.csv",
+            "test.csv",
+            ["name,value", "Item 1,10", "Item 2,20"]
+        ),
+        ({"name": "Item", "value": 10}, "test_single.csv", "test_single.csv", ["name,value", "Item,10"]),
+        ([{"test": "data"}], "test", "test.csv", ["test", "data"])
+    ], ids=["list_of_dicts", "single_dict", "auto_extension"])
+    def test_export(self, exporter_dir, data, filename, expected_name, expected_lines):
+        """Test exporting a list or single dict, adding the .csv extension when missing."""
+        exporter = CSVExporter(output_dir=exporter_dir)
+        
+        file_path = exporter.export(data, filename)
+        
+        assert Path(file_path).name == expected_name
+        assert Path(file_path).read_text(encoding='utf-8').splitlines() == expected_lines
+    
+    def test_flatten_nested_dict(self, exporter_dir):
         """Test flattening nested dictionaries."""
-        exporter = CSVExporter(output_dir=temp_output_dir)
+        exporter = CSVExporter(output_dir=exporter_dir)
         data = [
             {
                 "name": "Item",
@@ -130,18 +181,58 @@ class TestCSVExporter:
         
         file_path = exporter.export(data, "test_nested.csv", flatten_nested=True)
         
-        assert Path(file_path).exists()
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            assert 'nested_value' in rows[0]
-            assert 'nested_other' in rows[0]
+        assert Path(file_path).read_text(encoding='utf-8').splitlines() == [
+            "name,nested_other,nested_value", "Item,test,10"
+        ]
     
-    def test_format_value(self, temp_output_dir):
-        """Test value formatting."""
-        exporter = CSVExporter(output_dir=temp_output_dir)
+    def test_flatten_dict_order_and_depth(self, exporter_dir):
+        """Test flattening keeps depth-first key order and handles deep nesting."""
+        exporter = CSVExporter(output_dir=exporter_dir)
+        data = {"a": 1, "b": {"c": {"d": 2}, "e": [1, 2]}, "f": [{"g": 3}]}
+        
+        assert list(exporter._flatten_dict(data).items()) == [
+            ("a", 1), ("b_c_d", 2), ("b_e", "1, 2"), ("f", '[{"g": 3}]')
+        ]
         
-        assert exporter._format_value(None) == ''
-        assert exporter._format_value(True) == 'true'
-        assert exporter._format_value(False) == 'false'
-        assert exporter._format_value(123) == '123'
+        deep = {"leaf": 1}
+        for _ in range(5000):
+            deep = {"x": deep}
+        assert list(exporter._flatten_dict(deep).values()) == [1]
+    
+    def test_export_rows(self, exporter_dir):
+        """Test rows are written in sorted column order with formatted values."""
+        exporter = CSVExporter(output_dir=exporter_dir)
+        data = [{"name": "a, b", "ok": True}, {"name": "c", "extra": None}]
+        
+        file_path = exporter.export(data, "test_rows.csv")
+        
+        assert Path(file_path).read_text(encoding='utf-8').splitlines() == [
+            'extra,name,ok',
+            ',"a, b",true',
+            ',c,'
+        ]
+    
+    def test_export_with_fieldnames(self, exporter_dir):
+        """Test a known schema streams any iterable in the given column order."""
+        exporter = CSVExporter(output_dir=exporter_dir)
+        rows = ({"id": i, "name": f"repo{i}", "extra": "dropped"} for i in range(2))
+        
+        file_path = exporter.export(rows, "test_fields.csv", fieldnames=("name", "id"))
+        
+        assert Path(file_path).read_text(encoding='utf-8').splitlines() == [
+            'name,id',
+            'repo0,0',
+            'repo1,1'
+        ]
+    
+    def test_format_value(self):
+        """Test value formatting."""
+        format_value = CSVExporter._format_value
+        
+        assert format_value(None) == ''
+        assert format_value(True) == 'true'
+        assert format_value(False) == 'false'
+        assert format_value(123) == '123'
+        assert format_value('text') == 'text'
+        assert format_value(['a', 1]) == '["a", 1]'
+        assert format_value(OrderedDict(a=1)) == '{"a": 1}'
@@ -2,11 +2,26 @@
 Unit tests for GitHubCollector
 """
 
+import threading
+import time
 import pytest
+import requests
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from src.collectors.github_collector import GitHubCollector
 
 
+def _page(items, links=None):
+    """Build a lightweight paginated response stand-in."""
+    return SimpleNamespace(links=links or {}, json=lambda: items)
+
+
+@pytest.fixture(scope="class")
+def collector():
+    """Collector shared by tests that patch out _make_request."""
+    return GitHubCollector(api_key="test_token")
+
+
 class TestGitHubCollector:
     """Test cases for GitHubCollector."""
     
@@ -22,69 +37,199 @@ class TestGitHubCollector:
         collector = GitHubCollector(api_key="test_token")
         assert collector.session.headers['Authorization'] == 'token test_token'
     
-    @patch('src.collectors.github_collector.GitHubCollector._make_request')
-    def test_collect_user_repos(self, mock_request):
-        """Test collecting user repositories."""
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {"id": 1, "name": "repo1"},
-            {"id": 2, "name": "repo2"}
-        ]
-        mock_request.return_value = mock_response
-        
-        collector = GitHubCollector()
-        repos = collector.collect_user_repos("testuser")
+    @pytest.mark.parametrize("method_name, args, payload", [
+        (
+            "collect_user_repos",
+            ("testuser",),
+            [{"id": 1, "name": "repo1"}, {"id": 2, "name": "repo2"}]
+        ),
+        (
+            "collect_repo_issues",
+            ("owner", "repo"),
+            [{"id": 1, "title": "Issue 1", "state": "open"}]
+        ),
+        (
+            "collect_pull_requests",
+            ("owner", "repo"),
+            [{"id": 1, "title": "PR 1", "state": "open"}]
+        ),
+        (
+            "collect_user_profile",
+            ("testuser",),
+            {"login": "testuser", "name": "Test User", "public_repos": 10}
+        )
+    ])
+    def test_collect_methods(self, collector, method_name, args, payload):
+        """Test each collection method returns the API payload."""
+        with patch.object(GitHubCollector, '_make_request') as mock_request:
+            mock_request.return_value = _page(payload)
+            
+            result = getattr(collector, method_name)(*args)
         
-        assert len(repos) == 2
-        assert repos[0]["name"] == "repo1"
+        assert result == payload
         mock_request.assert_called()
     
-    @patch('src.collectors.github_collector.GitHubCollector._make_request')
-    def test_collect_repo_issues(self, mock_request):
-        """Test collecting repository issues."""
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {"id": 1, "title": "Issue 1", "state": "open"}
+    @patch.object(GitHubCollector, '_make_request')
+    def test_collect_paginated_concurrently(self, mock_request, collector):
+        """Test fetching remaining pages when the Link header names the last page."""
+        last_url = 'https://api.github.com/users/testuser/repos?per_page=2&page=3'
+        
+        def fake_request(endpoint, params=None, **kwargs):
+            page = params['page']
+            links = {'last': {'url': last_url}} if page == 1 else {}
+            return _page(
+                [{"id": page * 10 + i, "name": f"repo-{page}-{i}"} for i in range(2)],
+                links
+            )
+        
+        mock_request.side_effect = fake_request
+        
+        repos = collector.collect_user_repos("testuser", per_page=2)
+        
+        assert mock_request.call_count == 3
+        assert [repo["id"] for repo in repos] == [10, 11, 20, 21, 30, 31]
+    
+    def test_http2_client(self):
+        """Test requests are routed through the httpx client when enabled."""
+        httpx = pytest.importorskip('httpx')
+        pytest.importorskip('h2')
+        
+        def handler(request):
+            if request.url.path == '/users/missing':
+                return httpx.Response(404, request=request)
+            assert request.headers['Authorization'] == 'token test_token'
+            return httpx.Response(200, json={"login": "testuser"}, request=request)
+        
+        collector = GitHubCollector(api_key="test_token", rate_limit_delay=0, http2=True)
+        assert collector.client is not None
+        collector.client = httpx.Client(transport=httpx.MockTransport(handler))
+        
+        assert collector.collect_user_profile("testuser") == {"login": "testuser"}
+        with pytest.raises(requests.HTTPError):
+            collector._make_request('/users/missing')
+    
+    def test_async_pagination(self):
+        """Test remaining pages are fetched with the async client when HTTP/2 is on."""
+        httpx = pytest.importorskip('httpx')
+        pytest.importorskip('h2')
+        last_url = 'https://api.github.com/users/testuser/repos?page=3'
+        
+        def handler(request):
+            page = int(request.url.params['page'])
+            headers = {'Link': f'<{last_url}>; rel="last"'} if page == 1 else {}
+            return httpx.Response(200, json=[{"id": page}], headers=headers, request=request)
+        
+        collector = GitHubCollector(rate_limit_delay=0, http2=True)
+        collector.client = httpx.Client(transport=httpx.MockTransport(handler))
+        
+        with patch.object(
+            collector,
+            '_build_async_client',
+            side_effect=lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        ) as mock_build:
+            repos = collector.collect_user_repos("testuser")
+        
+        assert [repo["id"] for repo in repos] == [1, 2, 3]
+        mock_build.assert_called_once()
+        assert collector._async_local.client is None
+    
+    @patch.object(GitHubCollector, '_make_request')
+    def test_iter_user_repos_is_lazy(self, mock_request, collector):
+        """Test pages are only requested as the iterator is consumed."""
+        mock_request.side_effect = [
+            _page([{"id": 1}], {'next': {'url': 'https://api.github.com/users/testuser/repos?page=2'}}),
+            _page([{"id": 2}])
         ]
-        mock_request.return_value = mock_response
         
-        collector = GitHubCollector()
-        issues = collector.collect_repo_issues("owner", "repo")
+        repos = collector.iter_user_repos("testuser", per_page=1)
         
-        assert len(issues) == 1
-        assert issues[0]["title"] == "Issue 1"
+        assert mock_request.call_count == 0
+        assert next(repos) == {"id": 1}
+        assert mock_request.call_count == 1
+        assert list(repos) == [{"id": 2}]
+        assert mock_request.call_count == 2
     
-    @patch('src.collectors.github_collector.GitHubCollector._make_request')
-    def test_collect_pull_requests(self, mock_request):
-        """Test collecting pull requests."""
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {"id": 1, "title": "PR 1", "state": "open"}
+    @patch.object(GitHubCollector, '_make_request')
+    def test_collect_follows_next_link(self, mock_request, collector):
+        """Test sequential pagination stops when rel="next" is absent."""
+        mock_request.side_effect = [
+            _page([{"id": 1}, {"id": 2}], {'next': {'url': 'https://api.github.com/repos/o/r/issues?page=2'}}),
+            _page([{"id": 3}, {"id": 4}])
         ]
-        mock_request.return_value = mock_response
         
-        collector = GitHubCollector()
-        prs = collector.collect_pull_requests("owner", "repo")
-        
-        assert len(prs) == 1
-        assert prs[0]["title"] == "PR 1"
-    
-    @patch('src.collectors.github_collector.GitHubCollector._make_request')
-    def test_collect_user_profile(self, mock_request):
-        """Test collecting user profile."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "login": "testuser",
-            "name": "Test User",
-            "public_repos": 10
-        }
-        mock_request.return_value = mock_response
+        issues = collector.collect_repo_issues("o", "r", per_page=2)
         
-        collector = GitHubCollector()
-        profile = collector.collect_user_profile("testuser")
+        assert [issue["id"] for issue in issues] == [1, 2, 3, 4]
+        assert mock_request.call_count == 2
+    
+    @patch.object(GitHubCollector, '_make_request')
+    def test_make_requests_batch(self, mock_request):
+        """Test batched requests run on worker threads and keep their order."""
+        def fake_request(endpoint, params=None, **kwargs):
+            time.sleep(0.01 * (5 - params['page']))
+            return (params['page'], threading.current_thread().name)
+        
+        mock_request.side_effect = fake_request
+        
+        collector = GitHubCollector(max_workers=4)
+        responses = collector._make_requests_batch([
+            {'endpoint': '/x', 'params': {'page': page}} for page in range(5)
+        ])
         
-        assert profile["login"] == "testuser"
-        assert profile["public_repos"] == 10
+        assert [page for page, _ in responses] == [0, 1, 2, 3, 4]
+        assert threading.current_thread().name not in {name for _, name in responses}
+    
+    def test_pool_sized_for_concurrent_batches(self):
+        """Test the connection pool fits every request of concurrent batches."""
+        collector = GitHubCollector(max_workers=4, concurrent_batches=8)
+        
+        adapter = collector.session.get_adapter('https://api.github.com')
+        assert adapter._pool_maxsize == 32
+    
+    def test_network_blocked(self):
+        """Test un-mocked requests fail immediately instead of reaching GitHub."""
+        collector = GitHubCollector(rate_limit_delay=0)
+        
+        with pytest.raises(RuntimeError):
+            collector.session.get('https://api.github.com/users/testuser')
+    
+    def test_adaptive_pacing(self):
+        """Test pacing follows the X-RateLimit budget."""
+        collector = GitHubCollector(rate_limit_delay=0.5)
+        reset = str(time.time() + 100)
+        
+        collector._update_pacing({
+            'X-RateLimit-Limit': '5000', 'X-RateLimit-Remaining': '4900', 'X-RateLimit-Reset': reset
+        })
+        assert collector._budget_delay == 0.0
+        
+        collector._update_pacing({
+            'X-RateLimit-Limit': '5000', 'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': reset
+        })
+        assert collector._budget_delay == pytest.approx(10, abs=0.1)
+    
+    @patch('src.core.base_collector.time.sleep')
+    def test_rate_limited_403(self, mock_sleep):
+        """Test a 403 with an exhausted budget holds the next request until the reset."""
+        response = Mock(status_code=403)
+        response.headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(time.time() + 30)}
+        
+        collector = GitHubCollector(rate_limit_delay=0)
+        with pytest.raises(requests.HTTPError):
+            collector._handle_response(response)
+        mock_sleep.assert_not_called()
+        
+        collector._rate_limit()
+        assert mock_sleep.call_args[0][0] == pytest.approx(30, abs=1)
+    
+    def test_retry_strategy(self):
+        """Test urllib3 retries server errors but leaves rate limits to the collector."""
+        retries = GitHubCollector(max_retries=2).session.get_adapter('https://api.github.com').max_retries
+        
+        assert retries.connect == 2
+        assert 429 not in retries.status_forcelist
+        assert 503 in retries.status_forcelist
+        assert 'POST' not in retries.allowed_methods
     
     def test_collect_generic(self):
         """Test generic collect method routing."""
@@ -97,3 +242,57 @@ class TestGitHubCollector:
         
         with pytest.raises(ValueError):
             collector.collect('unknown_type')
+    
+    def test_collect_memoized(self):
+        """Test repeated collect calls reuse a copy of the first result."""
+        collector = GitHubCollector(memoize=True)
+        
+        with patch.object(collector, 'collect_user_repos', return_value=[{"id": 1}]) as mock_repos:
+            first = collector.collect('repos', username='testuser')
+            first.append({"id": 2})
+            second = collector.collect('repos', username='testuser')
+            collector.collect('repos', username='testuser', refresh=True)
+            collector.collect('repos', username='other')
+        
+        assert second == [{"id": 1}]
+        assert mock_repos.call_count == 3
+    
+    def test_collect_not_memoized(self):
+        """Test memoization is off by default and skips empty or failed results."""
+        collector = GitHubCollector()
+        with patch.object(collector, 'collect_user_repos', return_value=[{"id": 1}]) as mock_repos:
+            collector.collect('repos', username='testuser')
+            collector.collect('repos', username='testuser')
+        assert mock_repos.call_count == 2
+        
+        collector = GitHubCollector(memoize=True)
+        with patch.object(collector, 'collect_user_profile', return_value={}) as mock_profile:
+            collector.collect('profile', username='testuser')
+            collector.collect('profile', username='testuser')
+        assert mock_profile.call_count == 2
+        
+        def partial(**kwargs):
+            collector._handle_errors(requests.ConnectionError("reset"))
+            return [{"id": 1}]
+        
+        with patch.object(collector, 'collect_user_repos', side_effect=partial) as mock_repos:
+            collector.collect('repos', username='testuser')
+            collector.collect('repos', username='testuser')
+        assert mock_repos.call_count == 2
+    
+    @patch('src.core.base_collector.time.monotonic')
+    def test_collect_memo_expires(self, mock_monotonic):
+        """Test expired entries are dropped instead of accumulating."""
+        mock_monotonic.return_value = 0.0
+        collector = GitHubCollector(memoize=True)
+        
+        with patch.object(collector, 'collect_user_repos', return_value=[{"id": 1}]) as mock_repos:
+            collector.collect('repos', username='a')
+            collector.collect('repos', username='b')
+            mock_monotonic.return_value = 301.0
+            collector.collect('repos', username='a')
+            collector.collect('repos', username='c')
+        
+        assert mock_repos.call_count == 4
+        entries = GitHubCollector.collect.memo[collector]
+        assert sorted(dict(kwargs)['username'] for _, kwargs in entries) == ['a', 'c']
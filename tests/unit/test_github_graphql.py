@@ -0,0 +1,89 @@
+"""
+Unit tests for GitHubGraphQLCollector
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.collectors.github_graphql import GitHubGraphQLCollector
+
+
+def _repo_node(db_id, name):
+    return {
+        "databaseId": db_id,
+        "name": name,
+        "nameWithOwner": f"testuser/{name}",
+        "description": "A test repository",
+        "url": f"https://github.com/testuser/{name}",
+        "isPrivate": False,
+        "isFork": False,
+        "createdAt": "2023-01-01T00:00:00Z",
+        "updatedAt": "2023-12-01T00:00:00Z",
+        "pushedAt": "2023-12-01T00:00:00Z",
+        "stargazerCount": 42,
+        "forkCount": 10,
+        "primaryLanguage": {"name": "Python"},
+        "defaultBranchRef": {"name": "main"},
+        "watchers": {"totalCount": 5},
+        "issues": {"totalCount": 3},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "python"}}]}
+    }
+
+
+def _page(nodes, has_next, cursor=None):
+    payload = {
+        "data": {
+            "rateLimit": {"cost": 1, "remaining": 4999, "resetAt": "2030-01-01T00:00:00Z"},
+            "user": {
+                "repositories": {
+                    "nodes": nodes,
+                    "pageInfo": {"endCursor": cursor, "hasNextPage": has_next}
+                }
+            }
+        }
+    }
+    return SimpleNamespace(json=lambda: payload)
+
+
+class TestGitHubGraphQLCollector:
+    """Test cases for GitHubGraphQLCollector."""
+    
+    def test_set_auth(self):
+        """Test authentication setup."""
+        collector = GitHubGraphQLCollector(api_key="test_token")
+        assert collector.session.headers['Authorization'] == 'bearer test_token'
+    
+    @patch.object(GitHubGraphQLCollector, '_make_request')
+    def test_collect_user_repos(self, mock_request):
+        """Test cursor pagination and conversion to the REST shape."""
+        mock_request.side_effect = [
+            _page([_repo_node(1, "repo1")], True, "cursor1"),
+            _page([_repo_node(2, "repo2")], False)
+        ]
+        
+        collector = GitHubGraphQLCollector(api_key="test_token")
+        repos = collector.collect_user_repos("testuser")
+        
+        assert [repo["name"] for repo in repos] == ["repo1", "repo2"]
+        assert repos[0]["full_name"] == "testuser/repo1"
+        assert repos[0]["stargazers_count"] == 42
+        assert repos[0]["language"] == "Python"
+        assert repos[0]["topics"] == ["python"]
+        second_variables = mock_request.call_args_list[1].kwargs['json']['variables']
+        assert second_variables['after'] == "cursor1"
+    
+    @patch.object(GitHubGraphQLCollector, '_make_request')
+    def test_collect_user_repos_errors(self, mock_request):
+        """Test that GraphQL errors end collection gracefully."""
+        payload = {"errors": [{"message": "Bad credentials"}]}
+        mock_request.return_value = SimpleNamespace(json=lambda: payload)
+        
+        collector = GitHubGraphQLCollector(api_key="test_token")
+        assert collector.collect_user_repos("testuser") == []
+    
+    def test_collect_generic(self):
+        """Test generic collect method routing."""
+        collector = GitHubGraphQLCollector()
+        
+        with pytest.raises(ValueError):
+            collector.collect('unknown_type')
@@ -3,13 +3,16 @@ Unit tests for GitHubParser
 """
 
 import pytest
-from src.parsers.github_parser import GitHubParser
-from tests.conftest import (
-    sample_repo_data,
-    sample_issue_data,
-    sample_pr_data,
-    sample_profile_data
-)
+from datetime import datetime
+from dataclasses import asdict
+from src.parsers.github_parser import GitHubParser, _normalize_date
+from src.parsers.models import Repo
+
+
+@pytest.fixture(scope="class")
+def parser():
+    """Parser shared by the tests in a class (it holds no per-call state)."""
+    return GitHubParser()
 
 
 class TestGitHubParser:
@@ -20,9 +23,8 @@ class TestGitHubParser:
         parser = GitHubParser()
         assert parser is not None
     
-    def test_parse_repos(self, sample_repo_data):
+    def test_parse_repos(self, parser, sample_repo_data):
         """Test parsing repository data."""
-        parser = GitHubParser()
         parsed = parser.parse([sample_repo_data], data_type='repos')
         
         assert len(parsed) == 1
@@ -31,9 +33,8 @@ class TestGitHubParser:
         assert parsed[0]['forks'] == 10
         assert 'full_name' in parsed[0]
     
-    def test_parse_issues(self, sample_issue_data):
+    def test_parse_issues(self, parser, sample_issue_data):
         """Test parsing issue data."""
-        parser = GitHubParser()
         parsed = parser.parse([sample_issue_data], data_type='issues')
         
         assert len(parsed) == 1
@@ -42,9 +43,8 @@ class TestGitHubParser:
         assert parsed[0]['user'] == 'testuser'
         assert len(parsed[0]['labels']) == 2
     
-    def test_parse_prs(self, sample_pr_data):
+    def test_parse_prs(self, parser, sample_pr_data):
         """Test parsing pull request data."""
-        parser = GitHubParser()
         parsed = parser.parse([sample_pr_data], data_type='prs')
         
         assert len(parsed) == 1
@@ -54,9 +54,39 @@ class TestGitHubParser:
         assert parsed[0]['additions'] == 100
         assert parsed[0]['deletions'] == 50
     
-    def test_parse_profile(self, sample_profile_data):
+    def test_parse_stream(self, parser, sample_issue_data, sample_pr_data):
+        """Test lazily parsing an iterator of items."""
+        issue = dict(sample_issue_data, pull_request=None)
+        as_pr = dict(sample_issue_data, pull_request={"url": "https://example.com"})
+        
+        parsed = parser.parse_stream(iter([issue, as_pr]), data_type='issues')
+        
+        assert not isinstance(parsed, list)
+        assert list(parsed) == parser.parse([issue], data_type='issues')
+        with pytest.raises(ValueError):
+            list(parser.parse_stream([sample_pr_data], data_type='profile'))
+    
+    def test_fields_match_parsed_keys(self, parser, sample_repo_data, sample_issue_data,
+                                      sample_pr_data, sample_profile_data):
+        """Test the published schemas list the parsed keys in order."""
+        assert tuple(parser.parse([sample_repo_data], data_type='repos')[0]) == GitHubParser.REPO_FIELDS
+        assert tuple(parser.parse([sample_issue_data], data_type='issues')[0]) == GitHubParser.ISSUE_FIELDS
+        assert tuple(parser.parse([sample_pr_data], data_type='prs')[0]) == GitHubParser.PR_FIELDS
+        assert tuple(parser.parse(sample_profile_data, data_type='profile')) == GitHubParser.PROFILE_FIELDS
+    
+    def test_parse_as_models(self, parser, sample_repo_data, sample_profile_data):
+        """Test slotted records carry the same data as the dicts."""
+        repos = parser.parse([sample_repo_data], data_type='repos', as_models=True)
+        assert isinstance(repos[0], Repo)
+        assert not hasattr(repos[0], '__dict__')
+        assert asdict(repos[0]) == parser.parse([sample_repo_data], data_type='repos')[0]
+        
+        profile = parser.parse(sample_profile_data, data_type='profile', as_models=True)
+        assert profile.login == sample_profile_data['login']
+        assert list(parser.parse_stream([sample_repo_data], 'repos', as_models=True)) == repos
+    
+    def test_parse_profile(self, parser, sample_profile_data):
         """Test parsing profile data."""
-        parser = GitHubParser()
         parsed = parser.parse(sample_profile_data, data_type='profile')
         
         assert parsed['login'] == 'testuser'
@@ -64,35 +94,51 @@ class TestGitHubParser:
         assert parsed['public_repos'] == 10
         assert parsed['followers'] == 100
     
-    def test_auto_detect_repos(self, sample_repo_data):
+    def test_auto_detect_repos(self, parser, sample_repo_data):
         """Test auto-detection of repository data."""
-        parser = GitHubParser()
         parsed = parser.parse([sample_repo_data], data_type='auto')
         
         assert len(parsed) == 1
         assert 'name' in parsed[0]
     
-    def test_parse_date(self):
+    def test_parse_date(self, parser):
         """Test date parsing."""
-        parser = GitHubParser()
         date_str = "2023-01-01T00:00:00Z"
         parsed_date = parser._parse_date(date_str)
         
         assert parsed_date is not None
         assert '2023-01-01' in parsed_date
     
-    def test_validate_repos(self, sample_repo_data):
+    @pytest.mark.parametrize("date_str", [
+        "2023-01-01T00:00:00Z",
+        "2023-06-15T13:45:30Z",
+        "2023-06-15T13:45:30.250Z",
+        "2023-06-15T13:45:30+02:00"
+    ])
+    def test_parse_date_matches_fromisoformat(self, parser, date_str):
+        """Test the fast path and the full parse agree with datetime."""
+        expected = datetime.fromisoformat(date_str.replace('Z', '+00:00')).isoformat()
+        assert parser._parse_date(date_str) == expected
+    
+    def test_parse_date_cached(self, parser):
+        """Test repeated timestamps are normalized once and bad ones are kept."""
+        _normalize_date.cache_clear()
+        
+        assert parser._parse_date("2023-01-01T00:00:00.5Z") == "2023-01-01T00:00:00.500000+00:00"
+        assert parser._parse_date("2023-01-01T00:00:00.5Z") == "2023-01-01T00:00:00.500000+00:00"
+        assert _normalize_date.cache_info().hits == 1
+        assert parser._parse_date("not a date") == "not a date"
+        assert parser._parse_date(None) is None
+    
+    def test_validate_repos(self, parser, sample_repo_data):
         """Test validation of repository data."""
-        parser = GitHubParser()
         parsed = parser.parse([sample_repo_data], data_type='repos')
         
         assert parser.validate(parsed) is True
         assert parser.validate(parsed, required_fields=['name', 'full_name']) is True
     
-    def test_validate_invalid_data(self):
+    def test_validate_invalid_data(self, parser):
         """Test validation with invalid data."""
-        parser = GitHubParser()
-        
         assert parser.validate(None) is False
         assert parser.validate([]) is True
         assert parser.validate({}, required_fields=['missing_field']) is False
@@ -3,8 +3,34 @@ Unit tests for GitHubScraper
 """
 
 import pytest
-from unittest.mock import Mock, patch
-from src.collectors.github_scraper import GitHubScraper
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.collectors.github_scraper import GitHubScraper, _parse_count
+
+
+# One trending row with every field the parser extracts
+TRENDING_HTML = """
+<html>
+    <article class="Box-row">
+        <h2 class="h3 applied-text-shadow-small">
+            <a href="/owner/repo">owner/repo</a>
+        </h2>
+        <p class="col-9">Description</p>
+        <div class="f6">
+            <span itemprop="programmingLanguage">Python</span>
+            <a href="/owner/repo/stargazers">1,000</a>
+            <a href="/owner/repo/forks">100</a>
+            <span class="d-inline-block float-sm-right">50 stars today</span>
+        </div>
+    </article>
+</html>
+"""
+
+
+@pytest.fixture(scope="class")
+def scraper():
+    """Scraper shared by tests that patch out _make_request."""
+    return GitHubScraper()
 
 
 class TestGitHubScraper:
@@ -16,53 +42,74 @@ class TestGitHubScraper:
         assert scraper.base_url == "https://github.com"
         assert scraper.api_key is None
     
-    @patch('src.collectors.github_scraper.GitHubScraper._make_request')
-    def test_collect_trending(self, mock_request):
-        """Test collecting trending repos."""
-        mock_response = Mock()
-        mock_response.text = """
+    @pytest.mark.parametrize("html, expected", [
+        (TRENDING_HTML, [{
+            "full_name": "owner/repo",
+            "owner": "owner",
+            "name": "repo",
+            "description": "Description",
+            "language": "Python",
+            "stars_total": 1000,
+            "forks_total": 100,
+            "stars_since": 50,
+            "url": "https://github.com/owner/repo"
+        }]),
+        ("<html>Invalid HTML</html>", [])
+    ], ids=["valid", "malformed"])
+    def test_collect_trending(self, scraper, html, expected):
+        """Test collecting trending repos from a valid and a malformed page."""
+        with patch.object(GitHubScraper, '_make_request', return_value=SimpleNamespace(text=html)):
+            repos = scraper.collect_trending(language="python")
+        
+        assert repos == expected
+    
+    def test_parse_trending_without_lxml(self):
+        """Test that the BeautifulSoup fallback matches the XPath parser."""
+        html = """
         <html>
             <article class="Box-row">
-                <h2 class="h3 applied-text-shadow-small">
-                    <a href="/owner/repo">owner/repo</a>
-                </h2>
-                <p class="col-9">Description</p>
+                <h2 class="h3"><a href="/owner/repo">owner/repo</a></h2>
                 <div class="f6">
-                    <span itemprop="programmingLanguage">Python</span>
-                    <a href="/owner/repo/stargazers">1,000</a>
-                    <a href="/owner/repo/forks">100</a>
-                    <span class="d-inline-block float-sm-right">50 stars today</span>
+                    <a href="/owner/repo/stargazers">2,500</a>
+                    <a href="/owner/repo/forks">12</a>
                 </div>
             </article>
         </html>
         """
-        mock_request.return_value = mock_response
-        
         scraper = GitHubScraper()
-        repos = scraper.collect_trending(language="python")
+        expected = scraper._parse_trending_page(html)
         
-        assert len(repos) == 1
-        repo = repos[0]
-        assert repo["full_name"] == "owner/repo"
-        assert repo["owner"] == "owner"
-        assert repo["name"] == "repo"
-        assert repo["description"] == "Description"
-        assert repo["language"] == "Python"
-        assert repo["stars_total"] == 1000
-        assert repo["forks_total"] == 100
-        assert repo["stars_since"] == 50
-    
-    @patch('src.collectors.github_scraper.GitHubScraper._make_request')
-    def test_collect_trending_parsing_error(self, mock_request):
-        """Test collecting trending repos with malformed HTML."""
-        mock_response = Mock()
-        mock_response.text = "<html>Invalid HTML</html>"
-        mock_request.return_value = mock_response
+        with patch('src.collectors.github_scraper.lxml_html', None):
+            repos = scraper._parse_trending_page(html)
         
+        assert repos == expected
+        assert repos[0]["stars_total"] == 2500
+        assert repos[0]["language"] == "Unknown"
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("1,234", 1234),
+        (" 12.3k ", 12300),
+        ("4.35k", 4350),
+        ("1.2M", 1200000),
+        ("", 0),
+        ("n/a", 0),
+    ])
+    def test_parse_count(self, text, expected):
+        """Test parsing plain, comma-separated and abbreviated counts."""
+        assert _parse_count(text) == expected
+    
+    def test_collect_trending_multi(self):
+        """Test collecting several languages concurrently."""
         scraper = GitHubScraper()
-        repos = scraper.collect_trending()
         
-        assert len(repos) == 0
+        def fake_trending(language, since, refresh):
+            return [{"language": language, "since": since}]
+        
+        with patch.object(scraper, 'collect_trending', side_effect=fake_trending):
+            results = scraper.collect_trending_multi(["python", "rust"], since="weekly")
+        
+        assert list(results) == ["python", "rust"]
+        assert results["rust"] == [{"language": "rust", "since": "weekly"}]
     
     def test_collect_generic(self):
         """Test generic collect method."""
@@ -0,0 +1,45 @@
+"""
+Unit tests for pipeline helpers
+"""
+
+import threading
+import pytest
+from src.utils.pipeline import batched, pipelined
+
+
+class TestPipeline:
+    """Test cases for batched and pipelined."""
+    
+    def test_batched(self):
+        """Test grouping items into fixed-size batches."""
+        assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(batched([], 2)) == []
+    
+    def test_pipelined_preserves_order(self):
+        """Test transformed items come back in source order off the main thread."""
+        threads = set()
+        
+        def transform(batch):
+            threads.add(threading.current_thread().name)
+            return [item * 2 for item in batch]
+        
+        results = list(pipelined(batched(range(10), 3), transform, maxsize=1))
+        
+        assert results == [[0, 2, 4], [6, 8, 10], [12, 14, 16], [18]]
+        assert threading.current_thread().name not in threads
+    
+    def test_pipelined_propagates_errors(self):
+        """Test stage exceptions are re-raised in the consumer."""
+        def source():
+            yield 1
+            raise RuntimeError("fetch failed")
+        
+        with pytest.raises(RuntimeError, match="fetch failed"):
+            list(pipelined(source(), lambda item: item))
+    
+    def test_pipelined_stops_early(self):
+        """Test closing the iterator early does not hang the stages."""
+        results = pipelined(iter(range(1000)), lambda item: item, maxsize=1)
+        
+        assert next(results) == 0
+        results.close()
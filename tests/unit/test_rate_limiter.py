@@ -0,0 +1,68 @@
+"""
+Unit tests for TokenBucket
+"""
+
+import pytest
+from unittest.mock import patch
+from src.collectors.github_collector import GitHubCollector
+from src.utils.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+    
+    @patch('src.utils.rate_limiter.time.monotonic', return_value=100.0)
+    def test_burst_then_wait(self, mock_monotonic):
+        """Test requests burst up to capacity and then queue at the refill rate."""
+        bucket = TokenBucket(capacity=3, refill_rate=2)
+        
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(1.0)
+    
+    @patch('src.utils.rate_limiter.time.monotonic')
+    def test_refill_caps_at_capacity(self, mock_monotonic):
+        """Test idle time refills the bucket but never beyond capacity."""
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket.per_interval(2, 10)
+        bucket.acquire(2)
+        
+        mock_monotonic.return_value = 1000.0
+        assert bucket.acquire(2) == 0.0
+        assert bucket.acquire() == pytest.approx(5.0)
+    
+    @patch('src.utils.rate_limiter.time.monotonic', return_value=100.0)
+    def test_refund(self, mock_monotonic):
+        """Test refunded tokens are reusable but never exceed capacity."""
+        bucket = TokenBucket(capacity=1, refill_rate=1)
+        bucket.acquire()
+        bucket.refund()
+        assert bucket.acquire() == 0.0
+        
+        bucket.refund(5)
+        assert bucket.tokens == 1
+    
+    def test_invalid(self):
+        """Test that empty buckets are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(0, 1)
+    
+    @patch('src.core.base_collector.time.sleep')
+    def test_collector_waits_for_slowest_bucket(self, mock_sleep):
+        """Test nested buckets: the collector waits for the longest delay."""
+        minute = TokenBucket(capacity=1, refill_rate=1)
+        hour = TokenBucket(capacity=1, refill_rate=0.1)
+        collector = GitHubCollector(rate_limits=[minute, hour])
+        
+        collector._rate_limit()
+        mock_sleep.assert_not_called()
+        
+        collector._rate_limit()
+        assert mock_sleep.call_args[0][0] == pytest.approx(10, abs=0.1)
+    
+    def test_collector_default_burst(self):
+        """Test the default GitHub bucket allows one burst per worker."""
+        collector = GitHubCollector(rate_limit_delay=0.5, max_workers=4)
+        
+        assert [(b.capacity, b.refill_rate) for b in collector.rate_limits] == [(4, 2.0)]
+        assert GitHubCollector(rate_limit_delay=0).rate_limits == []
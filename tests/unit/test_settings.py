@@ -0,0 +1,31 @@
+"""
+Unit tests for Settings
+"""
+
+import dataclasses
+import pytest
+from src.config.settings import Settings
+
+
+class TestSettings:
+    """Test cases for Settings."""
+    
+    def test_from_env(self, monkeypatch):
+        """Test loading values from environment variables."""
+        monkeypatch.setenv('GITHUB_TOKENS', 'a, b,,c')
+        monkeypatch.setenv('RATE_LIMIT_DELAY', '2')
+        monkeypatch.setenv('CACHE_DIR', '')
+        
+        settings = Settings.from_env()
+        
+        assert settings.github_tokens == ('a', 'b', 'c')
+        assert settings.rate_limit_delay == 2.0
+        assert settings.cache_dir is None
+    
+    def test_frozen(self):
+        """Test that settings cannot be modified after loading."""
+        settings = Settings.from_env()
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            settings.output_dir = 'elsewhere'
+        assert not hasattr(settings, '__dict__')
@@ -0,0 +1,105 @@
+"""
+Unit tests for TokenPool
+"""
+
+import time
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from src.collectors.github_collector import GitHubCollector
+from src.collectors.token_pool import TokenPool
+
+
+class TestTokenPool:
+    """Test cases for TokenPool."""
+    
+    def test_requires_tokens(self):
+        """Test that an empty pool is rejected."""
+        with pytest.raises(ValueError):
+            TokenPool([])
+    
+    def test_round_robin_until_budgets_known(self):
+        """Test that tokens without a known budget are used in turn."""
+        pool = TokenPool(["a", "b", "c"])
+        assert [pool.acquire() for _ in range(4)] == ["a", "b", "c", "a"]
+    
+    def test_prefers_most_remaining(self):
+        """Test that the token with the largest budget is chosen."""
+        pool = TokenPool(["a", "b"])
+        reset = str(time.time() + 3600)
+        pool.update("a", {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": reset})
+        pool.update("b", {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": reset})
+        
+        assert pool.acquire() == "b"
+    
+    def test_parks_exhausted_token(self):
+        """Test that exhausted tokens are skipped until reset."""
+        pool = TokenPool(["a", "b"])
+        reset = str(time.time() + 3600)
+        pool.update("a", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset})
+        pool.update("b", {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": reset})
+        
+        assert pool.acquire() == "b"
+        assert pool.acquire() == "b"
+    
+    def test_collector_rotates_tokens(self):
+        """Test that the collector sends the pooled token per request."""
+        collector = GitHubCollector(api_key="a", api_keys=["b"], rate_limit_delay=0)
+        response = Mock(status_code=200, headers={})
+        
+        with patch.object(collector.session, 'request', return_value=response) as mock_request:
+            collector._make_request('/users/x')
+            collector._make_request('/users/x')
+        
+        sent = [call.kwargs['headers']['Authorization'] for call in mock_request.call_args_list]
+        assert sent == ['token a', 'token b']
+    
+    def test_cached_response_skips_token(self, tmp_path):
+        """Test that a cache hit is served without taking a token from the pool."""
+        collector = GitHubCollector(
+            api_key="a", api_keys=["b"], rate_limit_delay=0, cache_dir=str(tmp_path)
+        )
+        collector.cache.set(
+            'https://api.github.com/users/x', None, {'body': '{"login": "x"}', 'link': None},
+            scope=collector._cache_scope
+        )
+        
+        with patch.object(collector.token_pool, 'acquire', side_effect=AssertionError) as mock_acquire, \
+                patch.object(collector.session, 'request') as mock_request:
+            response = collector._make_request('/users/x')
+        
+        assert response.json() == {"login": "x"}
+        mock_acquire.assert_not_called()
+        mock_request.assert_not_called()
+    
+    def test_exhausted_token_falls_over_to_next(self):
+        """Test an exhausted token is parked and the request retried on the next one."""
+        collector = GitHubCollector(api_key="a", api_keys=["b"], rate_limit_delay=0)
+        reset = str(time.time() + 3000)
+        exhausted = Mock(status_code=403, headers={'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset})
+        ok = Mock(status_code=200, headers={'X-RateLimit-Remaining': '4999', 'X-RateLimit-Reset': reset})
+        
+        def fake_request(method, url, headers=None, **kwargs):
+            return exhausted if headers['Authorization'] == 'token a' else ok
+        
+        with patch.object(collector.session, 'request', side_effect=fake_request) as mock_request:
+            assert collector._make_request('/users/x') is ok
+            assert collector._make_request('/users/y') is ok
+        
+        sent = [call.kwargs['headers']['Authorization'] for call in mock_request.call_args_list]
+        assert sent == ['token a', 'token b', 'token b']
+        assert collector._next_request_at == 0.0
+    
+    def test_all_tokens_exhausted(self):
+        """Test exhausting every token raises without pausing the whole collector."""
+        collector = GitHubCollector(api_key="a", api_keys=["b"], rate_limit_delay=0)
+        headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(time.time() + 3000)}
+        exhausted = Mock(status_code=403, headers=headers)
+        
+        with patch.object(collector.session, 'request', return_value=exhausted) as mock_request:
+            with pytest.raises(requests.HTTPError):
+                collector._make_request('/users/x')
+        
+        assert mock_request.call_count == 2
+        assert collector._next_request_at == 0.0
+        assert all(budget.remaining == 0 for budget in collector.token_pool.budgets().values())